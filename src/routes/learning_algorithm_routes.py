@@ -75,7 +75,7 @@ def get_learning_insights() -> tuple:
     summary = {
         "total_posts_analyzed": len(learning_algorithm_service.performance_history),
         "insights_available": len([key for key, value in insights.items() if value]),
-        "last_analysis": learning_algorithm_service.performance_history[-1]["created_time"].isoformat()
+        "last_analysis": learning_algorithm_service.performance_history[-1].created_time.isoformat()
         if learning_algorithm_service.performance_history
         else None,
     }
@@ -210,16 +210,20 @@ def search_content():
         platform = request.args.get('platform')
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
+        hashtag = request.args.get('hashtag')
+        limit = request.args.get('limit', type=int)
         
         filters = {}
         if platform:
             filters['platform'] = platform
+        if hashtag:
+            filters['hashtag'] = hashtag
         if date_from:
             filters['date_from'] = date_from
         if date_to:
             filters['date_to'] = date_to
         
-        results = content_service.search_content(query, filters)
+        results = content_service.search_content(query, filters, max_results=limit)
         
         return jsonify({
             'success': True,
@@ -2,7 +2,7 @@
 
 from http import HTTPStatus
 
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, Response, current_app, jsonify
 
 from ..services.realtor_scraper_service import (
     MissingApifyApiKeyError,
@@ -10,6 +10,11 @@ from ..services.realtor_scraper_service import (
     serialize_scrape_response,
 )
 
+try:  # orjson is optional – fall back to jsonify when it is not installed
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 realtor_bp = Blueprint("realtor", __name__)
 _scraper_service = RealtorScraperService()
 
@@ -38,5 +43,9 @@ def get_windsor_essex_properties():
             HTTPStatus.INTERNAL_SERVER_ERROR,
         )
 
-    return jsonify(serialize_scrape_response(properties))
+    payload = serialize_scrape_response(properties)
+    if orjson is None:
+        return jsonify(payload)
+    # orjson serialises the Listing dataclasses natively and several times faster than jsonify.
+    return Response(orjson.dumps(payload), mimetype="application/json")
 
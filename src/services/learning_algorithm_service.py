@@ -2,19 +2,129 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from statistics import mean
-from typing import Dict, List, Optional
+import re
+from collections import Counter, deque
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .manual_content_service import ManualContentService
 
+_HISTORY_LIMIT = 500
+_HASHTAG_RE = re.compile(r"#\w+")
+_METRIC_KEYS = ("likes", "comments", "shares", "saves", "impressions", "reach")
+_ENGAGEMENT_WEIGHTS = (("likes", 1), ("comments", 2), ("shares", 3), ("saves", 2))
+# Weights aligned with ``_METRIC_KEYS`` so a record's metric tuple scores with one zip.
+_ENGAGEMENT_WEIGHT_TUPLE = tuple(dict(_ENGAGEMENT_WEIGHTS).get(key, 0) for key in _METRIC_KEYS)
+
+
+def _windowed_means(matrix: np.ndarray, timestamps: np.ndarray, cutoff: float) -> np.ndarray:
+    recent = timestamps >= cutoff
+    if not recent.any():
+        recent[:] = True
+    return matrix[recent].mean(axis=0)
+
+
+@dataclass(slots=True)
+class PostRecord:
+    """Normalised post kept in the learning history.
+
+    ``metrics`` holds integer counts in ``_METRIC_KEYS`` order; ``engagement_score`` is
+    derived from them once when the record is built.
+    """
+
+    id: Optional[str]
+    platform: str
+    content_type: str
+    text: str
+    hashtags: List[str]
+    created_time: datetime
+    metrics: Tuple[int, ...]
+    engagement_score: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.engagement_score = _engagement_score(self.metrics)
+
+    def metric(self, name: str) -> int:
+        return self.metrics[_METRIC_KEYS.index(name)]
+
+    def merge(self, other: "PostRecord") -> None:
+        """Overwrite this record in place with the fields of ``other``."""
+
+        for item in fields(self):
+            setattr(self, item.name, getattr(other, item.name))
+
+
+def _normalise_content_item(content: Dict, default_platform: str = "manual") -> Optional[PostRecord]:
+    """Map a stored content item onto the performance record used for analysis."""
+
+    if not isinstance(content, dict):
+        return None
+
+    text_content = content.get("content") or content.get("text") or content.get("caption")
+    if not text_content:
+        return None
+
+    metrics = content.get("engagement") or content.get("metrics") or {}
+    hashtags = [tag.lower() for tag in content.get("hashtags") or _HASHTAG_RE.findall(text_content)]
+    created_raw = content.get("uploaded_at") or content.get("created_at")
+    created_time = _parse_created_time(created_raw)
+
+    return PostRecord(
+        id=content.get("id") or content.get("content_id"),
+        platform=content.get("platform") or default_platform,
+        content_type=content.get("content_type", "text"),
+        text=text_content,
+        hashtags=hashtags,
+        created_time=created_time,
+        metrics=(
+            int(metrics.get("likes", 0) or 0),
+            int(metrics.get("comments", 0) or 0),
+            int(metrics.get("shares", 0) or 0),
+            int(metrics.get("saves", 0) or metrics.get("bookmarks", 0) or 0),
+            int(metrics.get("impressions", 0) or 0),
+            int(metrics.get("reach", 0) or 0),
+        ),
+    )
+
+
+def _engagement_score(metrics: Tuple[int, ...]) -> int:
+    return sum(value * weight for value, weight in zip(metrics, _ENGAGEMENT_WEIGHT_TUPLE))
+
+
+def _parse_created_time(value: object) -> datetime:
+    """Parse an ingest timestamp once; records keep the ``datetime`` for later passes."""
+
+    if isinstance(value, datetime):
+        parsed = value
+    elif value and isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now(timezone.utc)
+    else:
+        return datetime.now(timezone.utc)
+    # Naive timestamps are stored in UTC; tag them so every record compares consistently.
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed.astimezone(timezone.utc)
+
 
 class LearningAlgorithmService:
     """Analyse previously posted content to surface actionable insights."""
 
     def __init__(self) -> None:
-        self.performance_history: List[Dict] = []
+        self.performance_history: Deque[PostRecord] = deque(maxlen=_HISTORY_LIMIT)
+        self._history_index: Dict[str, PostRecord] = {}
+        # Column-oriented view of ``performance_history``; rebuilt lazily after changes.
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        # Running engagement sums and post counts, kept in step with the history. Hours
+        # are a fixed 24-slot domain; open-ended keys use ``[engagement_sum, post_count]``.
+        self._hour_sums = np.zeros(24, dtype=np.int64)
+        self._hour_counts = np.zeros(24, dtype=np.int64)
+        self._buckets: Dict[str, Dict] = {"content_type": {}}
+        self._hashtag_counts: Counter = Counter()
         self.learning_insights: Dict[str, Dict] = {
             "optimal_posting_times": {},
             "best_performing_content_types": {},
@@ -23,7 +133,8 @@ class LearningAlgorithmService:
             "high_engagement_patterns": {},
             "audience_preferences": {},
         }
-        self._manual_content_service = ManualContentService()
+        # Created on first use so importing the module does not touch the storage directory.
+        self._manual_content_service: Optional[ManualContentService] = None
 
     # ------------------------------------------------------------------
     # Data ingestion helpers
@@ -34,92 +145,120 @@ class LearningAlgorithmService:
         platform: str = "manual",
         content_items: Optional[List[Dict]] = None,
         limit: Optional[int] = None,
-    ) -> List[Dict]:
+    ) -> List[PostRecord]:
         """Normalise content items into a common performance structure."""
 
         if content_items is None:
+            if self._manual_content_service is None:
+                self._manual_content_service = ManualContentService()
             content_items = self._manual_content_service.get_all_content(limit=limit or 200)
 
-        processed_posts: List[Dict] = []
-        for item in content_items:
-            processed = self._process_manual_content(item, platform)
-            if processed:
-                processed_posts.append(processed)
-        return processed_posts
-
-    def _process_manual_content(self, content: Dict, default_platform: str) -> Optional[Dict]:
-        if not isinstance(content, dict):
-            return None
+        processed = (self._process_manual_content(item, platform) for item in content_items)
+        return [post for post in processed if post]
 
-        text_content = content.get("content") or content.get("text") or content.get("caption")
-        if not text_content:
-            return None
-
-        metrics = content.get("engagement") or content.get("metrics") or {}
-        hashtags = content.get("hashtags") or []
-        created_raw = content.get("uploaded_at") or content.get("created_at")
-        try:
-            created_time = datetime.fromisoformat((created_raw or "").replace("Z", "+00:00"))
-        except ValueError:
-            created_time = datetime.utcnow()
+    def _process_manual_content(self, content: Dict, default_platform: str) -> Optional[PostRecord]:
+        return _normalise_content_item(content, default_platform)
 
-        return {
-            "id": content.get("id") or content.get("content_id"),
-            "platform": content.get("platform") or default_platform,
-            "content_type": content.get("content_type", "text"),
-            "text": text_content,
-            "hashtags": hashtags,
-            "created_time": created_time,
-            "metrics": {
-                "likes": int(metrics.get("likes", 0) or 0),
-                "comments": int(metrics.get("comments", 0) or 0),
-                "shares": int(metrics.get("shares", 0) or 0),
-                "saves": int(metrics.get("saves", 0) or metrics.get("bookmarks", 0) or 0),
-                "impressions": int(metrics.get("impressions", 0) or 0),
-                "reach": int(metrics.get("reach", 0) or 0),
-            },
-        }
-
-    def update_performance_history(self, posts: List[Dict]) -> None:
+    def update_performance_history(self, posts: List[PostRecord]) -> None:
         if not posts:
             return
-        self.performance_history.extend(posts)
-        self.performance_history = self.performance_history[-500:]
+
+        for post in posts:
+            post_id = post.id
+            existing = self._history_index.get(str(post_id)) if post_id is not None else None
+            if existing is not None:
+                self._apply_contribution(existing, -1)
+                existing.merge(post)
+                self._apply_contribution(existing, 1)
+                continue
+            if len(self.performance_history) == self.performance_history.maxlen:
+                evicted = self.performance_history[0]
+                self._apply_contribution(evicted, -1)
+                if evicted.id is not None:
+                    self._history_index.pop(str(evicted.id), None)
+            self.performance_history.append(post)
+            self._apply_contribution(post, 1)
+            if post_id is not None:
+                self._history_index[str(post_id)] = post
+
+        self._arrays = None
         self._update_insights()
 
     # ------------------------------------------------------------------
     # Insight generation
     # ------------------------------------------------------------------
-    def _update_insights(self) -> None:
-        if not self.performance_history:
+    def _apply_contribution(self, entry: PostRecord, sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) ``entry`` from the running buckets."""
+
+        score = entry.engagement_score
+        hour = entry.created_time.hour
+        self._hour_sums[hour] += sign * score
+        self._hour_counts[hour] += sign
+
+        buckets = self._buckets["content_type"]
+        key = entry.content_type
+        bucket = buckets.setdefault(key, [0, 0])
+        bucket[0] += sign * score
+        bucket[1] += sign
+        if bucket[1] <= 0:
+            del buckets[key]
+
+        hashtags = entry.hashtags
+        if sign > 0:
+            self._hashtag_counts.update(hashtags)
             return
-
-        by_hour: Dict[int, List[int]] = defaultdict(list)
-        content_scores: Dict[str, List[int]] = defaultdict(list)
-        hashtag_counter: Counter = Counter()
-
+        self._hashtag_counts.subtract(hashtags)
+        for tag in hashtags:
+            if self._hashtag_counts.get(tag, 0) <= 0:
+                self._hashtag_counts.pop(tag, None)
+
+    def _ranked_hour_means(self) -> Dict[int, float]:
+        hours = np.flatnonzero(self._hour_counts)
+        means = self._hour_sums[hours] / self._hour_counts[hours]
+        order = np.argsort(-means, kind="stable")
+        return {int(hours[index]): round(float(means[index]), 2) for index in order}
+
+    def _ranked_bucket_means(self, name: str) -> Dict:
+        means = {key: total / count for key, (total, count) in self._buckets[name].items()}
+        return {key: round(avg, 2) for key, avg in sorted(means.items(), key=lambda kv: kv[1], reverse=True)}
+
+    def _history_arrays(self) -> Dict[str, np.ndarray]:
+        """Return column arrays over ``performance_history``.
+
+        ``metrics`` is a rows-by-``_METRIC_KEYS`` matrix; ``created_ts`` and
+        ``engagement`` hold each record's timestamp and engagement score.
+        """
+
+        if self._arrays is not None:
+            return self._arrays
+
+        # Single traversal of the history: every column is gathered while each
+        # entry is touched once.
+        metric_rows: List[Tuple[int, ...]] = []
+        timestamps: List[float] = []
+        scores: List[int] = []
         for entry in self.performance_history:
-            metrics = entry["metrics"]
-            engagement = self._engagement_score(metrics)
-            created_time = entry["created_time"]
-            by_hour[created_time.hour].append(engagement)
-            content_scores[entry.get("content_type", "text")].append(engagement)
-            hashtag_counter.update(entry.get("hashtags") or [])
-
-        optimal_hours = {
-            hour: round(mean(scores), 2)
-            for hour, scores in sorted(by_hour.items(), key=lambda kv: mean(kv[1]), reverse=True)
-        }
-        best_content_types = {
-            ctype: round(mean(scores), 2)
-            for ctype, scores in sorted(content_scores.items(), key=lambda kv: mean(kv[1]), reverse=True)
+            metric_rows.append(entry.metrics)
+            timestamps.append(entry.created_time.timestamp())
+            scores.append(entry.engagement_score)
+
+        arrays = {
+            "metrics": np.array(metric_rows, dtype=np.int64).reshape(len(metric_rows), len(_METRIC_KEYS)),
+            "created_ts": np.array(timestamps, dtype=np.float64),
+            "engagement": np.array(scores, dtype=np.int64),
         }
+        self._arrays = arrays
+        return arrays
+
+    def _update_insights(self) -> None:
+        if not self.performance_history:
+            return
 
         self.learning_insights.update(
             {
-                "optimal_posting_times": optimal_hours,
-                "best_performing_content_types": best_content_types,
-                "effective_hashtags": dict(hashtag_counter.most_common(10)),
+                "optimal_posting_times": self._ranked_hour_means(),
+                "best_performing_content_types": self._ranked_bucket_means("content_type"),
+                "effective_hashtags": dict(self._hashtag_counts.most_common(10)),
                 "high_engagement_patterns": self._summarise_engagement_patterns(),
             }
         )
@@ -128,25 +267,10 @@ class LearningAlgorithmService:
         if not self.performance_history:
             return {}
 
-        last_month = datetime.utcnow() - timedelta(days=30)
-        recent = [entry for entry in self.performance_history if entry["created_time"] >= last_month]
-        if not recent:
-            recent = self.performance_history
-
-        averages = {
-            key: round(mean(entry["metrics"].get(key, 0) for entry in recent), 2)
-            for key in ["likes", "comments", "shares", "saves", "impressions", "reach"]
-        }
-        return averages
-
-    @staticmethod
-    def _engagement_score(metrics: Dict[str, int]) -> int:
-        return (
-            metrics.get("likes", 0)
-            + metrics.get("comments", 0) * 2
-            + metrics.get("shares", 0) * 3
-            + metrics.get("saves", 0) * 2
-        )
+        arrays = self._history_arrays()
+        last_month = datetime.now(timezone.utc) - timedelta(days=30)
+        means = _windowed_means(arrays["metrics"], arrays["created_ts"], last_month.timestamp())
+        return {key: round(float(value), 2) for key, value in zip(_METRIC_KEYS, means)}
 
     # ------------------------------------------------------------------
     # Public API consumed by routes
@@ -158,10 +282,8 @@ class LearningAlgorithmService:
         last_entry = self.performance_history[-1]
         summary = {
             "total_posts": len(self.performance_history),
-            "last_post_analyzed": last_entry["created_time"].isoformat(),
-            "average_engagement": round(
-                mean(self._engagement_score(entry["metrics"]) for entry in self.performance_history), 2
-            ),
+            "last_post_analyzed": last_entry.created_time.isoformat(),
+            "average_engagement": round(float(self._history_arrays()["engagement"].mean()), 2),
         }
         summary.update(self._summarise_engagement_patterns())
         return summary
@@ -175,7 +297,7 @@ class LearningAlgorithmService:
 
         best_hashtags = list(self.learning_insights.get("effective_hashtags", {}).keys())[:5]
         best_content_types = self.learning_insights.get("best_performing_content_types", {})
-        recommended_type = content_type or (best_content_types.keys() or ["educational"])[0]
+        recommended_type = content_type or next(iter(best_content_types), "educational")
 
         return {
             "recommended_content_type": recommended_type,
@@ -184,10 +306,11 @@ class LearningAlgorithmService:
             "engagement_optimization_tips": "Post during the top-performing hours and mention Windsor-Essex explicitly.",
         }
 
-    def get_recent_posts(self, limit: int = 20) -> List[Dict]:
-        return self.performance_history[-limit:]
+    def get_recent_posts(self, limit: int = 20) -> List[PostRecord]:
+        start = max(len(self.performance_history) - limit, 0)
+        return list(islice(self.performance_history, start, None))
 
 
 learning_algorithm_service = LearningAlgorithmService()
 
-__all__ = ["LearningAlgorithmService", "learning_algorithm_service"]
+__all__ = ["LearningAlgorithmService", "PostRecord", "learning_algorithm_service"]
@@ -2,21 +2,253 @@
 
 from __future__ import annotations
 
+import bisect
+import contextlib
+import copy
+import csv
+import heapq
+import io
 import json
+import mmap
+import os
 import re
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:  # orjson is optional – fall back to the stdlib codec when it is not installed
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # pyahocorasick is optional – phrase matching falls back to substring scans
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_STORAGE_DIR = BASE_DIR / "data" / "manual"
+# Larger payloads are parsed straight from a read-only mapping instead of a read() copy.
+MMAP_THRESHOLD_BYTES = 16 * 1024
+# Cache misses are read on a thread pool once there are enough of them to amortise it.
+PARALLEL_READ_THRESHOLD = 16
+MAX_READ_WORKERS = 32
+# Imports at least this large are processed and written on a thread pool.
+PARALLEL_IMPORT_THRESHOLD = 8
+# Saves mostly wait on the file system (the GIL is released there), so oversubscribe the CPUs.
+MAX_IMPORT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Distinct texts remembered by the cached text analysers between imports.
+TEXT_CACHE_SIZE = 4096
+# get_content_stats only covers this many of the most recent posts.
+STATS_WINDOW = 1000
+# Shape written by ``_utcnow_iso``; such strings order lexicographically by time.
+_CANONICAL_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+# Hashtags and mentions in one scan; the first group tells them apart.
+_TAG_RE = re.compile(r"([#@])\w+")
+
+CTA_PHRASES = (
+    "contact me",
+    "call me",
+    "dm me",
+    "message me",
+    "text me",
+    "reach out",
+    "get in touch",
+    "let's talk",
+    "let's chat",
+    "schedule",
+    "book",
+    "visit",
+    "see more",
+    "click here",
+    "learn more",
+    "find out",
+    "discover",
+    "explore",
+    "sign up",
+    "register",
+    "subscribe",
+    "follow",
+    "buy now",
+    "shop now",
+    "order now",
+    "get started",
+)
+POSITIVE_WORDS = frozenset(
+    {
+        "amazing",
+        "awesome",
+        "beautiful",
+        "best",
+        "excellent",
+        "fantastic",
+        "great",
+        "happy",
+        "incredible",
+        "love",
+        "perfect",
+        "wonderful",
+        "excited",
+        "thrilled",
+        "delighted",
+        "pleased",
+        "satisfied",
+    }
+)
+NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "terrible",
+        "awful",
+        "horrible",
+        "worst",
+        "hate",
+        "disappointed",
+        "frustrated",
+        "angry",
+        "sad",
+        "upset",
+    }
+)
+
+
+def _build_automaton(entries: Iterable[Tuple[str, Any]]) -> Optional[Any]:
+    """Compile ``(phrase, value)`` pairs into one Aho-Corasick automaton, if available."""
+
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase, value in entries:
+        automaton.add_word(phrase, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once per process so each text is scanned in a single pass for all phrases.
+_CTA_AUTOMATON = _build_automaton((phrase, phrase) for phrase in CTA_PHRASES)
+
+
+def _alternation(phrases: Iterable[str]) -> "re.Pattern[str]":
+    """Compile ``phrases`` into one regex, longest first so overlapping prefixes prefer the longer phrase."""
+
+    return re.compile("|".join(map(re.escape, sorted(phrases, key=len, reverse=True))))
+
+
+# Single-pass fallback for when pyahocorasick is not installed.
+_CTA_RE = _alternation(CTA_PHRASES)
+# Sentiment compares whole words, so "unhappy" does not count as "happy".
+_WORD_RE = re.compile(r"[a-z']+")
+
+
+# Text analysis depends only on the string, so repeated captions (common in bulk
+# imports) are analysed once. Results are immutable; callers copy what they keep.
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _scan_tags(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return ``(hashtags, mentions)`` from a single pass over ``text``."""
+
+    hashtags: List[str] = []
+    mentions: List[str] = []
+    for match in _TAG_RE.finditer(text):
+        (hashtags if match.group(1) == "#" else mentions).append(match.group(0).lower())
+    return tuple(hashtags), tuple(mentions)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _detect_call_to_action(text: str) -> bool:
+    text_lower = text.lower()
+    if _CTA_AUTOMATON is not None:
+        return next(_CTA_AUTOMATON.iter(text_lower), None) is not None
+    return _CTA_RE.search(text_lower) is not None
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _analyze_basic_sentiment(text: str) -> str:
+    # Each distinct word counts once.
+    words = set(_WORD_RE.findall(text.lower()))
+    positive_count = len(words & POSITIVE_WORDS)
+    negative_count = len(words & NEGATIVE_WORDS)
+
+    if positive_count > negative_count:
+        return "positive"
+    if negative_count > positive_count:
+        return "negative"
+    return "neutral"
+
+
+def _clear_text_caches() -> None:
+    for cached in (_scan_tags, _detect_call_to_action, _analyze_basic_sentiment):
+        cached.cache_clear()
+
+
+def _normalise_hashtag(tag: Any) -> Optional[str]:
+    if not isinstance(tag, str) or not tag.strip("# "):
+        return None
+    return "#" + tag.strip("# ").lower()
+
+
+def _index_key(value: Any) -> Optional[str]:
+    """``value`` as an index or counter key; stored JSON may hold lists or objects where text belongs."""
+
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _payload_hashtags(payload: Dict) -> List[str]:
+    """Hashtags of ``payload`` as index keys, ignoring a malformed ``hashtags`` value."""
+
+    hashtags = payload.get("hashtags")
+    return [_index_key(tag) for tag in hashtags] if isinstance(hashtags, list) else []
+
+
+def _hashtag_keys(payload: Dict) -> Set[str]:
+    """Distinct normalised hashtags of ``payload`` for the inverted index."""
+
+    keys = (_normalise_hashtag(tag) for tag in _payload_hashtags(payload))
+    return {key for key in keys if key}
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _json_dumps(payload: Any, indent: bool = False) -> bytes:
+    """Serialise ``payload`` to UTF-8 JSON bytes, compact unless ``indent`` is set."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option)
+    if indent:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _stat_stamp(stat: os.stat_result) -> Tuple[int, int, int]:
+    """Identity of a file version: ``(st_ino, st_mtime_ns, st_size)``."""
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _format_utc(moment: datetime) -> str:
+    """Render an aware UTC ``moment`` as ``YYYY-MM-DDTHH:MM:SSZ``."""
+
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
 def _utcnow_iso() -> str:
     """Return the current UTC time in ISO 8601 format with a trailing ``Z``."""
 
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # strftime over gmtime skips building and reformatting a datetime.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _coerce_datetime(value: Optional[str]) -> datetime:
@@ -26,18 +258,149 @@ def _coerce_datetime(value: Optional[str]) -> datetime:
         return datetime.min
 
     try:
-        cleaned = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(cleaned)
+        # Python 3.11+ accepts the trailing ``Z`` natively.
+        return datetime.fromisoformat(value)
     except ValueError:
         return datetime.min
 
 
+def _timestamp_sort_key(value: Optional[str]) -> str:
+    """Return a string that orders like the timestamp ``value`` (``""`` when invalid).
+
+    Timestamps already in the canonical ``YYYY-MM-DDTHH:MM:SSZ`` form are used as-is;
+    anything else is parsed once and rewritten into that form.
+    """
+
+    if not isinstance(value, str):
+        return ""
+    if _CANONICAL_TIMESTAMP_RE.fullmatch(value):
+        return value
+    return _parse_sort_key(value)
+
+
+# Foreign timestamps (offsets, naive values, fractional seconds) recur across items
+# and search filters, so each distinct string goes through fromisoformat only once.
+@lru_cache(maxsize=8192)
+def _parse_sort_key(value: str) -> str:
+    parsed = _coerce_datetime(value)
+    if parsed == datetime.min:
+        return ""
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return _format_utc(parsed.astimezone(timezone.utc))
+
+
+def _safe_metric(item: Dict, metric: str) -> int:
+    metrics = item.get("engagement") or item.get("metrics") or {}
+    value = metrics.get(metric) if isinstance(metrics, dict) else 0
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _discount(counter: Counter, keys: Iterable[Any]) -> None:
+    for key in keys:
+        remaining = counter.get(key, 0) - 1
+        if remaining > 0:
+            counter[key] = remaining
+        else:
+            counter.pop(key, None)
+
+
+class _StatsAggregate:
+    """Running totals behind :meth:`ManualContentService.get_content_stats`.
+
+    Payloads are added with ``sign=1`` and withdrawn with ``sign=-1`` as they
+    enter and leave the cache, so a stats request only has to format the totals.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.platforms: Counter = Counter()
+        self.content_types: Counter = Counter()
+        self.hashtags: Counter = Counter()
+        self.likes = self.comments = self.shares = 0
+        # Sorted canonical upload timestamps; the 30-day window is one bisect away.
+        self.uploaded: List[str] = []
+
+    def apply(self, item: Dict, sign: int, uploaded: str) -> None:
+        """Add (``sign=1``) or withdraw (``sign=-1``) ``item`` uploaded at sort key ``uploaded``."""
+
+        platform = _index_key(item.get("platform", "unknown"))
+        content_type = _index_key(item.get("content_type", "text"))
+        hashtags = _payload_hashtags(item)
+        if sign > 0:
+            self.platforms[platform] += 1
+            self.content_types[content_type] += 1
+            self.hashtags.update(hashtags)
+            bisect.insort(self.uploaded, uploaded)
+        else:
+            _discount(self.platforms, (platform,))
+            _discount(self.content_types, (content_type,))
+            _discount(self.hashtags, hashtags)
+            del self.uploaded[bisect.bisect_left(self.uploaded, uploaded)]
+        self.total += sign
+        self.likes += sign * _safe_metric(item, "likes")
+        self.comments += sign * _safe_metric(item, "comments")
+        self.shares += sign * _safe_metric(item, "shares")
+
+    def snapshot(self) -> Dict:
+        thirty_days_ago = _format_utc(datetime.now(timezone.utc) - timedelta(days=30))
+        recent_count = len(self.uploaded) - bisect.bisect_left(self.uploaded, thirty_days_ago)
+        total_posts = self.total
+        return {
+            "total_posts": total_posts,
+            "platforms": dict(self.platforms),
+            "content_types": dict(self.content_types),
+            "recent_activity": {
+                "posts_last_30_days": recent_count,
+                "avg_posts_per_day": (recent_count / 30) if recent_count else 0,
+            },
+            "hashtag_usage": dict(self.hashtags.most_common(10)),
+            "engagement_summary": {
+                "total_likes": self.likes,
+                "total_comments": self.comments,
+                "total_shares": self.shares,
+                "avg_likes_per_post": (self.likes / total_posts) if total_posts else 0,
+                "avg_comments_per_post": (self.comments / total_posts) if total_posts else 0,
+            },
+        }
+
+
 class ManualContentService:
     """Persist manually uploaded posts and derive lightweight analytics."""
 
+    # Shared by every instance and created on first use; file reads release the GIL.
+    _read_pool: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_read_pool(cls) -> ThreadPoolExecutor:
+        if cls._read_pool is None:
+            cls._read_pool = ThreadPoolExecutor(max_workers=MAX_READ_WORKERS, thread_name_prefix="manual-content-read")
+        return cls._read_pool
+
     def __init__(self, storage_path: Optional[Path] = None) -> None:
         self._storage_path = Path(storage_path) if storage_path else DEFAULT_STORAGE_DIR
         self._storage_path.mkdir(parents=True, exist_ok=True)
+        # Parsed payloads keyed by file name with the ``(st_ino, st_mtime_ns, st_size)`` they were
+        # read at; atomic replaces always change the inode.
+        # Several service instances share the directory, so entries are revalidated
+        # against the file system instead of being trusted blindly.
+        self._cache: Dict[str, Tuple[Tuple[int, int, int], Dict]] = {}
+        # Secondary index of cached file names by ``platform`` for filtered searches.
+        self._by_platform: Dict[Optional[str], Set[str]] = {}
+        # Inverted index of cached file names by normalised hashtag.
+        self._by_hashtag: Dict[str, Set[str]] = {}
+        # Upload-time sort key per cached file name: the manifest that ranking, date
+        # filters and the stats window read instead of re-parsing ``uploaded_at``.
+        self._upload_keys: Dict[str, str] = {}
+        # Lower-cased search text per cached payload (keyed by ``id()``; dropped with the entry).
+        self._haystacks: Dict[int, str] = {}
+        # Stats totals over every cached payload, kept in step by _cache_store/_cache_drop.
+        self._stats = _StatsAggregate()
+        # Guards the cache and its indexes; imports write from worker threads.
+        self._cache_lock = threading.RLock()
 
     # ------------------------------------------------------------------
     # Basic CRUD helpers
@@ -45,51 +408,205 @@ class ManualContentService:
     def _content_path(self, content_id: str) -> Path:
         return self._storage_path / f"{content_id}.json"
 
-    def save_content(self, content_data: Dict) -> str:
-        """Persist a content payload and return the generated identifier."""
+    @staticmethod
+    def _read_json(path: Path, size: Optional[int] = None) -> Optional[Dict]:
+        """Parse the JSON file at ``path``; ``size`` is its already-known ``st_size``, if any.
 
-        payload = dict(content_data)
-        content_id = payload.get("id") or str(uuid.uuid4())
-        payload.update(
-            {
-                "id": content_id,
-                "uploaded_at": payload.get("uploaded_at") or _utcnow_iso(),
-                "status": payload.get("status", "active"),
-            }
-        )
+        Files are read through raw descriptors so a small file costs open, read and
+        close only, with no buffered-file setup or extra fstat.
+        """
 
-        with self._content_path(content_id).open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=2, ensure_ascii=False)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            if size is None:
+                size = os.fstat(fd).st_size
+            if size > MMAP_THRESHOLD_BYTES:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return _json_loads(view)
+            # One byte of slack detects a file that grew since it was stat'ed.
+            data = os.read(fd, size + 1)
+            if len(data) > size:
+                chunks = [data]
+                while chunk := os.read(fd, 64 * 1024):
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+            return _json_loads(data)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
 
-        return content_id
+    @staticmethod
+    def _file_stamp(path: Path) -> Tuple[int, int, int]:
+        return _stat_stamp(path.stat())
 
-    def get_content(self, content_id: str) -> Optional[Dict]:
-        """Return the stored payload for ``content_id`` if it exists."""
+    def _write_json(self, path: Path, payload: Dict) -> None:
+        """Atomically replace ``path`` so readers never observe a partially written file."""
 
-        path = self._content_path(content_id)
-        if not path.exists():
-            return None
+        blob = memoryview(_json_dumps(payload))
+        tmp_name = self._storage_path / f".{uuid.uuid4().hex}.tmp"
+        # New files get 0o666 minus the current umask, like any other file the process creates.
+        fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            try:
+                with contextlib.suppress(FileNotFoundError):
+                    os.fchmod(fd, os.stat(path).st_mode & 0o7777)  # keep an existing file's permissions
+                while blob:
+                    blob = blob[os.write(fd, blob):]
+                # Stamp our own file: a later stat of ``path`` may see another writer's replace.
+                stamp = _stat_stamp(os.fstat(fd))
+            finally:
+                os.close(fd)
+            os.replace(tmp_name, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        self._cache_store(path.name, stamp, payload)
+
+    def _cache_store(self, name: str, stamp: Tuple[int, int, int], payload: Dict) -> None:
+        with self._cache_lock:
+            self._cache_drop(name)
+            self._cache[name] = (stamp, payload)
+            uploaded = self._upload_keys[name] = _timestamp_sort_key(payload.get("uploaded_at"))
+            self._by_platform.setdefault(_index_key(payload.get("platform")), set()).add(name)
+            for hashtag in _hashtag_keys(payload):
+                self._by_hashtag.setdefault(hashtag, set()).add(name)
+            self._stats.apply(payload, 1, uploaded)
+
+    def _cache_drop(self, name: str) -> None:
+        with self._cache_lock:
+            cached = self._cache.pop(name, None)
+            if cached is None:
+                return
+            self._haystacks.pop(id(cached[1]), None)
+            self._stats.apply(cached[1], -1, self._upload_keys.pop(name))
+            self._unindex(self._by_platform, (_index_key(cached[1].get("platform")),), name)
+            self._unindex(self._by_hashtag, _hashtag_keys(cached[1]), name)
+
+    @staticmethod
+    def _unindex(index: Dict[Any, Set[str]], keys: Iterable[Any], name: str) -> None:
+        for key in keys:
+            names = index.get(key)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[key]
+
+    def _load_cached(self, path: Path) -> Optional[Dict]:
+        """Return the parsed payload at ``path``, re-reading it only when it changed."""
 
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                return json.load(fh)
-        except (OSError, json.JSONDecodeError):
+            stamp = self._file_stamp(path)
+        except OSError:
+            self._cache_drop(path.name)
             return None
 
-    def get_all_content(self, limit: int = 50) -> List[Dict]:
-        """Return the most recent content items ordered by upload time."""
+        cached = self._cache.get(path.name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
-        items: List[Dict] = []
-        for path in sorted(self._storage_path.glob("*.json")):
+        payload = self._read_json(path, stamp[2])
+        if payload is None:
+            self._cache_drop(path.name)
+            return None
+        self._cache_store(path.name, stamp, payload)
+        return payload
+
+    def _sync(self) -> List[str]:
+        """Bring the cache in line with the storage directory and return its file names in order."""
+
+        with os.scandir(self._storage_path) as it:
+            entries = sorted((entry for entry in it if entry.name.endswith(".json")), key=attrgetter("name"))
+        seen = {entry.name for entry in entries}
+        with self._cache_lock:
+            stale = self._cache.keys() - seen
+        for name in stale:
+            self._cache_drop(name)
+
+        misses: List[Tuple[Path, Tuple[int, int, int]]] = []
+        for entry in entries:
             try:
-                with path.open("r", encoding="utf-8") as fh:
-                    payload = json.load(fh)
-                    items.append(payload)
-            except (OSError, json.JSONDecodeError):
+                stat = entry.stat()
+            except OSError:
+                self._cache_drop(entry.name)
                 continue
+            stamp = _stat_stamp(stat)
+            cached = self._cache.get(entry.name)
+            if cached is None or cached[0] != stamp:
+                misses.append((Path(entry.path), stamp))
+
+        if len(misses) >= PARALLEL_READ_THRESHOLD:
+            paths = [path for path, _ in misses]
+            sizes = [stamp[2] for _, stamp in misses]
+            loaded = self._get_read_pool().map(self._read_json, paths, sizes)
+        else:
+            loaded = (self._read_json(path, size) for path, (_, _, size) in misses)
+        for (path, stamp), payload in zip(misses, loaded):
+            if payload is None:
+                self._cache_drop(path.name)
+            else:
+                self._cache_store(path.name, stamp, payload)
+
+        return [entry.name for entry in entries]
+
+    def save_content(self, content_data: Dict, now: Optional[str] = None) -> str:
+        """Persist a content payload and return the generated identifier.
+
+        ``content_data`` is completed in place with ``id``, ``uploaded_at`` and
+        ``status`` and then kept as the cached payload, so callers hand over
+        ownership of the dict and must not mutate it afterwards. ``now`` lets
+        batch callers share one timestamp instead of reading the clock per item.
+        """
+
+        content_id = content_data.get("id") or str(uuid.uuid4())
+        content_data["id"] = content_id
+        if not content_data.get("uploaded_at"):
+            content_data["uploaded_at"] = now or _utcnow_iso()
+        content_data.setdefault("status", "active")
+
+        self._write_json(self._content_path(content_id), content_data)
+
+        return content_id
+
+    def get_content(self, content_id: str) -> Optional[Dict]:
+        """Return the stored payload for ``content_id`` if it exists."""
+
+        payload = self._load_cached(self._content_path(content_id))
+        return copy.deepcopy(payload) if payload is not None else None
+
+    def get_all_content(self, limit: Optional[int] = 50) -> List[Dict]:
+        """Return the most recent content items ordered by upload time.
+
+        ``limit`` behaves like a slice bound: ``None`` returns every item and a
+        negative value drops that many of the oldest items.
+        """
+
+        return [copy.deepcopy(item) for item in self._recent_items(limit)]
+
+    def _recent_items(self, limit: Optional[int]) -> List[Dict]:
+        """Like :meth:`get_all_content` but returns the shared cached payloads (read-only)."""
+
+        return [payload for _, payload in self._recent_entries(self._sync(), limit)]
 
-        items.sort(key=lambda entry: _coerce_datetime(entry.get("uploaded_at")), reverse=True)
-        return items[:limit]
+    def _recent_entries(self, names: Iterable[str], limit: Optional[int]) -> List[Tuple[str, Dict]]:
+        """Return ``(upload sort key, payload)`` for the ``limit`` newest cached ``names``.
+
+        Ranking reads only the upload-key manifest; ties keep the order of ``names``.
+        ``None`` and negative limits are applied as slice bounds over the full ranking.
+        """
+
+        with self._cache_lock:
+            live = [name for name in names if name in self._cache]
+            if limit is None or limit < 0:
+                ranked = sorted(live, key=self._upload_keys.__getitem__, reverse=True)[:limit]
+            else:
+                ranked = heapq.nlargest(limit, live, key=self._upload_keys.__getitem__)
+            return [(self._upload_keys[name], self._cache[name][1]) for name in ranked]
 
     def update_content(self, content_id: str, updates: Dict) -> bool:
         """Apply ``updates`` to the stored content and persist the result."""
@@ -98,11 +615,10 @@ class ManualContentService:
         if current is None:
             return False
 
-        current.update(dict(updates))
+        current.update(updates)
         current["updated_at"] = _utcnow_iso()
 
-        with self._content_path(content_id).open("w", encoding="utf-8") as fh:
-            json.dump(current, fh, indent=2, ensure_ascii=False)
+        self._write_json(self._content_path(content_id), current)
 
         return True
 
@@ -110,6 +626,7 @@ class ManualContentService:
         """Remove the persisted payload associated with ``content_id``."""
 
         path = self._content_path(content_id)
+        self._cache_drop(path.name)
         try:
             path.unlink()
             return True
@@ -121,103 +638,93 @@ class ManualContentService:
     # ------------------------------------------------------------------
     # Query helpers and analytics
     # ------------------------------------------------------------------
-    def search_content(self, query: str, filters: Optional[Dict] = None) -> List[Dict]:
-        """Return items matching ``query`` and the provided ``filters``."""
+    def search_content(self, query: str, filters: Optional[Dict] = None, max_results: Optional[int] = None) -> List[Dict]:
+        """Return items matching ``query`` and the provided ``filters``, newest first.
+
+        ``filters`` may hold ``platform``, ``hashtag`` (exact tag, ``#`` optional),
+        ``date_from`` and ``date_to``; platform and hashtag are answered from the
+        cache indexes. Scanning stops once ``max_results`` matches have been collected.
+        """
+
+        if max_results is not None and max_results <= 0:
+            return []
 
         filters = filters or {}
         query_lower = query.lower().strip()
-        date_from = _coerce_datetime(filters.get("date_from")) if filters.get("date_from") else None
-        date_to = _coerce_datetime(filters.get("date_to")) if filters.get("date_to") else None
+        date_from = _timestamp_sort_key(filters.get("date_from")) if filters.get("date_from") else None
+        date_to = _timestamp_sort_key(filters.get("date_to")) if filters.get("date_to") else None
+
+        platform = filters.get("platform")
+        hashtag = _normalise_hashtag(filters.get("hashtag"))
+        names = self._sync()
+        if platform or hashtag:
+            with self._cache_lock:
+                indexed = [self._by_platform.get(platform, set())] if platform else []
+                if hashtag:
+                    indexed.append(self._by_hashtag.get(hashtag, set()))
+                allowed = set.intersection(*indexed)
+            names = [name for name in names if name in allowed]
+        candidates = self._recent_entries(names, 1000)
 
         results: List[Dict] = []
-        for item in self.get_all_content(limit=1000):
-            if filters.get("platform") and item.get("platform") != filters["platform"]:
-                continue
-
-            uploaded_at = _coerce_datetime(item.get("uploaded_at"))
+        for uploaded_at, item in candidates:
             if date_from and uploaded_at < date_from:
-                continue
+                # Candidates are newest first, so everything after this is older too.
+                break
             if date_to and uploaded_at > date_to:
                 continue
 
-            if query_lower:
-                haystack = " ".join(
-                    [
-                        item.get("text", ""),
-                        item.get("caption", ""),
-                        item.get("platform", ""),
-                        " ".join(item.get("hashtags", [])),
-                    ]
-                ).lower()
-                if query_lower not in haystack:
-                    continue
+            if query_lower and query_lower not in self._haystack(item):
+                continue
 
-            results.append(item)
+            results.append(copy.deepcopy(item))
+            if max_results is not None and len(results) >= max_results:
+                break
 
         return results
 
+    def _haystack(self, item: Dict) -> str:
+        haystack = self._haystacks.get(id(item))
+        if haystack is None:
+            haystack = " ".join(
+                [
+                    item.get("text", ""),
+                    item.get("caption", ""),
+                    item.get("platform", ""),
+                    " ".join(item.get("hashtags", [])),
+                ]
+            ).lower()
+            self._haystacks[id(item)] = haystack
+        return haystack
+
     def get_content_stats(self) -> Dict:
         """Return aggregate statistics for the stored manual content."""
 
-        content_items = self.get_all_content(limit=1000)
-        total_posts = len(content_items)
-        stats = {
-            "total_posts": total_posts,
-            "platforms": {},
-            "content_types": {},
-            "recent_activity": {},
-            "hashtag_usage": {},
-            "engagement_summary": {},
-        }
-
-        for item in content_items:
-            platform = item.get("platform", "unknown")
-            stats["platforms"][platform] = stats["platforms"].get(platform, 0) + 1
-
-            content_type = item.get("content_type", "text")
-            stats["content_types"][content_type] = stats["content_types"].get(content_type, 0) + 1
-
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent = [i for i in content_items if _coerce_datetime(i.get("uploaded_at")) >= thirty_days_ago]
-        stats["recent_activity"] = {
-            "posts_last_30_days": len(recent),
-            "avg_posts_per_day": (len(recent) / 30) if recent else 0,
-        }
-
-        hashtag_counts: Dict[str, int] = {}
-        for item in content_items:
-            for hashtag in item.get("hashtags", []):
-                hashtag_counts[hashtag] = hashtag_counts.get(hashtag, 0) + 1
-        stats["hashtag_usage"] = dict(sorted(hashtag_counts.items(), key=lambda kv: kv[1], reverse=True)[:10])
-
-        total_likes = sum(self._safe_metric(item, "likes") for item in content_items)
-        total_comments = sum(self._safe_metric(item, "comments") for item in content_items)
-        total_shares = sum(self._safe_metric(item, "shares") for item in content_items)
-        stats["engagement_summary"] = {
-            "total_likes": total_likes,
-            "total_comments": total_comments,
-            "total_shares": total_shares,
-            "avg_likes_per_post": (total_likes / total_posts) if total_posts else 0,
-            "avg_comments_per_post": (total_comments / total_posts) if total_posts else 0,
-        }
+        names = self._sync()
+        with self._cache_lock:
+            if len(self._cache) <= STATS_WINDOW:
+                return self._stats.snapshot()
 
-        return stats
+        # Only the most recent posts count once the store outgrows the window.
+        window = _StatsAggregate()
+        for uploaded, item in self._recent_entries(names, STATS_WINDOW):
+            window.apply(item, 1, uploaded)
+        return window.snapshot()
 
     # ------------------------------------------------------------------
     # Content enrichment helpers
     # ------------------------------------------------------------------
     def extract_hashtags(self, text: str) -> List[str]:
-        return [match.lower() for match in re.findall(r"#\w+", text or "")]
+        return list(_scan_tags(text or "")[0])
 
     def extract_mentions(self, text: str) -> List[str]:
-        return [match.lower() for match in re.findall(r"@\w+", text or "")]
+        return list(_scan_tags(text or "")[1])
 
-    def process_content_upload(self, content_data: Dict) -> Dict:
-        """Normalise uploaded content and derive lightweight metadata."""
+    def process_content_upload(self, content_data: Dict, now: Optional[str] = None) -> Dict:
+        """Normalise uploaded content and derive lightweight metadata (``now`` as in :meth:`save_content`)."""
 
         text = content_data.get("text") or content_data.get("caption") or ""
-        hashtags = self.extract_hashtags(text)
-        mentions = self.extract_mentions(text)
+        hashtags, mentions = _scan_tags(text)
 
         word_count = len(text.split()) if text else 0
         char_count = len(text)
@@ -230,146 +737,73 @@ class ManualContentService:
 
         enriched = {
             **content_data,
-            "hashtags": hashtags,
-            "mentions": mentions,
+            "hashtags": list(hashtags),
+            "mentions": list(mentions),
             "content_type": content_type,
             "word_count": word_count,
             "char_count": char_count,
             "has_cta": self._detect_call_to_action(text),
             "sentiment": self._analyze_basic_sentiment(text),
-            "processed_at": _utcnow_iso(),
+            "processed_at": now or _utcnow_iso(),
         }
         return enriched
 
     def _detect_call_to_action(self, text: str) -> bool:
-        if not text:
-            return False
-
-        phrases = (
-            "contact me",
-            "call me",
-            "dm me",
-            "message me",
-            "text me",
-            "reach out",
-            "get in touch",
-            "let's talk",
-            "let's chat",
-            "schedule",
-            "book",
-            "visit",
-            "see more",
-            "click here",
-            "learn more",
-            "find out",
-            "discover",
-            "explore",
-            "sign up",
-            "register",
-            "subscribe",
-            "follow",
-            "buy now",
-            "shop now",
-            "order now",
-            "get started",
-        )
-        text_lower = text.lower()
-        return any(phrase in text_lower for phrase in phrases)
+        return _detect_call_to_action(text) if text else False
 
     def _analyze_basic_sentiment(self, text: str) -> str:
-        if not text:
-            return "neutral"
-
-        positive_words = {
-            "amazing",
-            "awesome",
-            "beautiful",
-            "best",
-            "excellent",
-            "fantastic",
-            "great",
-            "happy",
-            "incredible",
-            "love",
-            "perfect",
-            "wonderful",
-            "excited",
-            "thrilled",
-            "delighted",
-            "pleased",
-            "satisfied",
-        }
-        negative_words = {
-            "bad",
-            "terrible",
-            "awful",
-            "horrible",
-            "worst",
-            "hate",
-            "disappointed",
-            "frustrated",
-            "angry",
-            "sad",
-            "upset",
-        }
-
-        lowered = text.lower()
-        positive_count = sum(1 for word in positive_words if word in lowered)
-        negative_count = sum(1 for word in negative_words if word in lowered)
-
-        if positive_count > negative_count:
-            return "positive"
-        if negative_count > positive_count:
-            return "negative"
-        return "neutral"
+        return _analyze_basic_sentiment(text) if text else "neutral"
 
     def export_content(self, format_type: str = "json") -> str:
-        items = self.get_all_content(limit=1000)
+        items = self._recent_items(1000)
         if format_type == "json":
-            return json.dumps(items, indent=2, ensure_ascii=False)
+            return _json_dumps(items, indent=True).decode("utf-8")
 
         if format_type == "csv":
             if not items:
                 return ""
 
-            fieldnames = sorted({key for item in items for key in item.keys()})
-            rows: List[str] = [",".join(fieldnames)]
+            fieldnames = sorted(set().union(*items))
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerow(fieldnames)
+            writer = csv.writer(buffer, quoting=csv.QUOTE_ALL, lineterminator="\n")
             for item in items:
-                values: List[str] = []
-                for field in fieldnames:
-                    value = item.get(field, "")
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value, ensure_ascii=False)
-                    escaped = str(value).replace('"', '""')
-                    values.append(f'"{escaped}"')
-                rows.append(",".join(values))
-            return "\n".join(rows)
+                writer.writerow(
+                    [
+                        json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else str(value)
+                        for value in (item.get(field, "") for field in fieldnames)
+                    ]
+                )
+            return buffer.getvalue().rstrip("\n")
 
         raise ValueError("Unsupported export format: expected 'json' or 'csv'.")
 
     def import_content(self, content_list: Iterable[Dict]) -> Dict:
+        items = list(content_list)
+        # One timestamp for the whole batch; second precision makes per-item reads moot.
+        import_one = partial(self._import_one, now=_utcnow_iso())
+        if len(items) >= PARALLEL_IMPORT_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(MAX_IMPORT_WORKERS, len(items))) as executor:
+                outcomes = list(executor.map(import_one, items))
+        else:
+            outcomes = [import_one(item) for item in items]
+
         results = {"imported": 0, "failed": 0, "errors": []}
-        for index, item in enumerate(content_list, start=1):
-            try:
-                processed = self.process_content_upload(item)
-                self.save_content(processed)
+        for index, error in enumerate(outcomes, start=1):
+            if error is None:
                 results["imported"] += 1
-            except Exception as exc:  # pragma: no cover - defensive catch
+            else:
                 results["failed"] += 1
-                results["errors"].append(f"Item {index}: {exc}")
+                results["errors"].append(f"Item {index}: {error}")
+        _clear_text_caches()
         return results
 
-    # ------------------------------------------------------------------
-    # Utility helpers
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _safe_metric(item: Dict, metric: str) -> int:
-        metrics = item.get("engagement") or item.get("metrics") or {}
-        value = metrics.get(metric) if isinstance(metrics, dict) else 0
+    def _import_one(self, item: Dict, now: Optional[str] = None) -> Optional[Exception]:
         try:
-            return int(value or 0)
-        except (TypeError, ValueError):
-            return 0
+            self.save_content(self.process_content_upload(item, now), now)
+        except Exception as exc:  # pragma: no cover - defensive catch
+            return exc
+        return None
 
 
 __all__ = ["ManualContentService"]
@@ -7,6 +7,10 @@ from dotenv import load_dotenv
 # Load the environment variables we will set in Render
 load_dotenv()
 
+GRAPH_API_URL = "https://graph.facebook.com/v18.0/me"
+# (connect, read) seconds, so a stuck peer cannot hang the test.
+REQUEST_TIMEOUT = (3.05, 10)
+
 def run_test():
     """
     A simple, safe test to check if a Meta access token is valid.
@@ -25,13 +29,13 @@ def run_test():
 
     # 2. Define the API endpoint to get basic profile info
     # This is a simple and safe endpoint to test the connection.
-    url = f"https://graph.facebook.com/v18.0/me?fields=id,name&access_token={user_access_token}"
+    params = {"fields": "id,name", "access_token": user_access_token}
 
-    print(f"Attempting to connect to URL: {url[:60]}..." ) # Print only the start of the URL for security
+    print(f"Attempting to connect to URL: {GRAPH_API_URL}") # The token travels in params and is never printed
 
     try:
         # 3. Make the API request
-        response = requests.get(url)
+        response = requests.get(GRAPH_API_URL, params=params, timeout=REQUEST_TIMEOUT)
         response_data = response.json()
 
         # 4. Check the result
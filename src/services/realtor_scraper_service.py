@@ -5,14 +5,26 @@ from __future__ import annotations
 import logging
 import math
 import os
+import queue
+import random
 import re
+import sys
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from apify_client import ApifyClient
 
+try:  # pyahocorasick is optional – detail labels fall back to substring scans
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 BASE_REALTOR_URL = "https://www.realtor.ca"
+_BASE_REALTOR_URL_WITH_SLASH = BASE_REALTOR_URL + "/"
 
 WINDSOR_ESSEX_START_URLS = [
     "https://www.realtor.ca/on/windsor/real-estate",
@@ -26,23 +38,291 @@ WINDSOR_ESSEX_START_URLS = [
     "https://www.realtor.ca/on/belle-river/real-estate",
 ]
 
-WINDSOR_ESSEX_CITIES = [
-    "windsor",
-    "tecumseh",
-    "lasalle",
-    "amherstburg",
-    "lakeshore",
-    "kingsville",
-    "leamington",
-    "essex",
-    "belle river",
-    "harrow",
-    "maidstone",
-    "mcgregor",
-    "cottam",
-    "stoney point",
-    "staples",
-]
+WINDSOR_ESSEX_CITIES = frozenset(
+    {
+        "windsor",
+        "tecumseh",
+        "lasalle",
+        "amherstburg",
+        "lakeshore",
+        "kingsville",
+        "leamington",
+        "essex",
+        "belle river",
+        "harrow",
+        "maidstone",
+        "mcgregor",
+        "cottam",
+        "stoney point",
+        "staples",
+    }
+)
+
+
+_NON_NUMERIC_RE = re.compile(r"[^0-9.,-]+")
+_NUMBER_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+_ABSOLUTE_URL_RE = re.compile(r"https?://", re.IGNORECASE)
+# Realtor.ca serves each photo under several size directories; these collapse to one key.
+_IMAGE_SIZE_DIR_RE = re.compile(r"/(?:lowres|highres|thumb|medium)/", re.IGNORECASE)
+_URL_QUERY_RE = re.compile(r"[?#].*$")
+
+# Apify run states after which the dataset will not receive more items.
+TERMINAL_RUN_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
+
+
+# Dataset items buffered ahead of normalisation by the prefetch thread.
+PREFETCH_BUFFER_SIZE = 1024
+
+
+class _PrefetchEnd:
+    """Marks the end of a prefetched stream, carrying the producer's error if any."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+
+
+def _prefetch(items: Iterable[Any], buffer_size: int = PREFETCH_BUFFER_SIZE) -> Iterator[Any]:
+    """Yield ``items`` while a daemon thread keeps pulling the next ones.
+
+    Dataset paging is network-bound, so fetching the next page while the caller
+    normalises the current one overlaps the two instead of running them serially.
+    Errors raised by ``items`` are re-raised in the consumer. Closing the generator
+    stops the producer, closes ``items`` and waits for the thread to exit, so
+    callers that may stop early should close it in a ``finally`` block.
+    """
+
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def offer(item: Any) -> bool:
+        # Poll ``stop`` while the buffer is full so an abandoned consumer never strands the producer.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not offer(item):
+                    return
+        except BaseException as exc:  # surfaced to the consumer
+            offer(_PrefetchEnd(exc))
+            return
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+        offer(_PrefetchEnd())
+
+    producer = threading.Thread(target=produce, name="apify-dataset-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _PrefetchEnd):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full buffer so it can observe ``stop``.
+        while not buffer.empty():
+            buffer.get_nowait()
+        producer.join()
+
+
+PathSet = Tuple[Tuple[str, ...], ...]
+
+
+def _split_paths(*paths: str) -> PathSet:
+    return tuple(tuple(path.split(".")) for path in paths)
+
+
+# Lookup paths into the raw Apify records, split into key segments once at import.
+_DETAIL_PATHS = _split_paths(
+    "details",
+    "property.details",
+    "propertyDetails",
+    "building.details",
+)
+_BEDROOM_PATHS = _split_paths(
+    "bedrooms",
+    "bedroomsTotal",
+    "bedroomsAboveGround",
+    "property.bedrooms",
+    "property.building.bedrooms",
+    "building.bedrooms",
+    "building.bedroomsTotal",
+    "summary.bedrooms",
+)
+_BATHROOM_PATHS = _split_paths(
+    "bathrooms",
+    "bathroomsTotal",
+    "property.bathrooms",
+    "property.building.bathrooms",
+    "building.bathrooms",
+    "summary.bathrooms",
+)
+_SQUARE_FEET_PATHS = _split_paths(
+    "sizeInterior",
+    "building.sizeInterior",
+    "building.totalFinishedArea",
+    "property.building.sizeInterior",
+    "property.squareFeet",
+    "squareFootage",
+    "area",
+)
+_LOT_SIZE_PATHS = _split_paths(
+    "land.sizeTotal",
+    "land.sizeTotalText",
+    "land.sizeFrontage",
+    "property.land.sizeTotal",
+    "lotSize",
+    "lotSizeArea",
+    "property.landSize",
+)
+_YEAR_BUILT_PATHS = _split_paths(
+    "building.builtYear",
+    "building.constructedDate",
+    "property.building.builtYear",
+    "property.building.constructedDate",
+)
+_LATITUDE_PATHS = _split_paths(
+    "coordinates.lat",
+    "coordinates.latitude",
+    "location.lat",
+    "location.latitude",
+    "property.location.lat",
+    "property.location.latitude",
+    "geo.lat",
+    "geo.latitude",
+)
+_LONGITUDE_PATHS = _split_paths(
+    "coordinates.lng",
+    "coordinates.lon",
+    "coordinates.longitude",
+    "location.lng",
+    "location.lon",
+    "location.longitude",
+    "property.location.lng",
+    "property.location.lon",
+    "property.location.longitude",
+    "geo.lng",
+    "geo.lon",
+    "geo.longitude",
+)
+
+
+# Label keywords that identify each feature in free-form listing details.
+DETAIL_KEYWORDS = {
+    "bedrooms": ("bedroom", "bed"),
+    "bathrooms": ("bathroom", "bath"),
+    "squareFeet": ("square feet", "sqft", "interior"),
+    "lotSize": ("lot size", "size total", "land size"),
+    "yearBuilt": ("built", "constructed", "year"),
+}
+
+
+def _build_detail_automaton() -> Optional[Any]:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for tag, keywords in DETAIL_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, tag)
+    automaton.make_automaton()
+    return automaton
+
+
+# Finds every feature keyword in a label with one scan.
+_DETAIL_AUTOMATON = _build_detail_automaton()
+
+
+def _detail_tags(label: str) -> Set[str]:
+    """Return the feature tags whose keywords occur in the lower-cased ``label``."""
+
+    if _DETAIL_AUTOMATON is not None:
+        return {tag for _, tag in _DETAIL_AUTOMATON.iter(label)}
+    return {tag for tag, keywords in DETAIL_KEYWORDS.items() if any(keyword in label for keyword in keywords)}
+
+
+def _get_segments(data: Any, segments: Tuple[str, ...]) -> Any:
+    # Most lookups miss (each feature tries several alternative paths), so test membership
+    # rather than catching KeyError/TypeError, which is several times slower on a miss.
+    current = data
+    for segment in segments:
+        if isinstance(current, dict) and segment in current:
+            current = current[segment]
+        else:
+            return None
+    return current
+
+
+def _strip_hidden_fields(item: Any) -> Any:
+    """Drop the ``#``-prefixed fields Apify attaches to raw dataset items."""
+
+    if isinstance(item, dict):
+        return {key: value for key, value in item.items() if not key.startswith("#")}
+    return item
+
+
+def _canonical_image_key(url: str) -> str:
+    """Identity of a photo regardless of its size directory, query string or case."""
+
+    return _URL_QUERY_RE.sub("", _IMAGE_SIZE_DIR_RE.sub("/img/", url)).lower()
+
+
+def _number_from_text(value: str) -> Optional[float]:
+    """Return the first number in ``value`` after stripping currency and unit text."""
+
+    match = _NUMBER_RE.search(_NON_NUMERIC_RE.sub("", value))
+    if match:
+        try:
+            return float(match.group(0).replace(",", ""))
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(slots=True)
+class Listing:
+    """Normalised Realtor.ca listing.
+
+    Field names follow the JSON keys the frontend reads, so ``orjson`` and Flask's
+    ``jsonify`` can serialise instances directly.
+    """
+
+    id: Any
+    mlsNumber: Optional[str]
+    address: Optional[str]
+    city: Optional[str]
+    province: Optional[str]
+    postalCode: Optional[str]
+    country: Optional[str]
+    price: Optional[float]
+    priceFormatted: Optional[str]
+    priceText: Optional[str]
+    propertyType: Optional[str]
+    description: Optional[str]
+    bedrooms: Optional[float]
+    bathrooms: Optional[float]
+    squareFeet: Optional[float]
+    lotSize: Optional[float]
+    lotSizeText: Optional[str]
+    yearBuilt: Optional[float]
+    listingUrl: Optional[str]
+    images: List[str]
+    agents: List[Dict[str, Optional[str]]]
+    brokerage: Optional[str]
+    coordinates: Optional[Dict[str, float]]
+    lastUpdated: Any
 
 
 class MissingApifyApiKeyError(RuntimeError):
@@ -65,7 +345,7 @@ class RealtorScraperService:
         *,
         max_items: int = 500,
         dataset_timeout_ms: int = 120_000,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Listing]:
         """Scrape Realtor.ca for Windsor-Essex listings via Apify."""
 
         if not self.is_configured:
@@ -82,7 +362,7 @@ class RealtorScraperService:
         }
 
         try:
-            run = client.actor("apify/realtor-ca-scraper").call(run_input)
+            run = client.actor("apify/realtor-ca-scraper").call(run_input=run_input)
         except Exception as exc:  # pragma: no cover - network failures
             self.logger.exception("Apify scraping run failed: %%s", exc)
             raise RuntimeError("Unable to execute Apify actor for Realtor.ca scrape") from exc
@@ -91,19 +371,26 @@ class RealtorScraperService:
         if not dataset_id:
             raise RuntimeError("Apify run completed without providing a dataset id")
 
-        self._wait_for_dataset_ready(client, dataset_id, dataset_timeout_ms)
-        raw_items = self._collect_dataset_items(client, dataset_id)
-
-        normalized_listings: List[Dict[str, Any]] = []
-        for record in raw_items:
-            listing = self._normalize_listing(record)
-            if not listing:
-                continue
-            city = listing.get("city")
-            if city and city.lower() in WINDSOR_ESSEX_CITIES:
-                normalized_listings.append(listing)
+        self._wait_for_dataset_ready(client, run, dataset_timeout_ms)
+        listings: List[Listing] = []
+        seen_keys: Set[str] = set()
+        records = _prefetch(self._collect_dataset_items(client, dataset_id, max_items))
+        try:
+            # Out-of-area records are dropped on their city alone, before the full normalisation.
+            local_records = (record for record in records if self._peek_city(record) in WINDSOR_ESSEX_CITIES)
+            for listing in map(self._normalize_listing, local_records):
+                if not listing:
+                    continue
+                # Deduplicate as listings are produced; the first occurrence wins.
+                key = self._listing_key(listing)
+                if key and key not in seen_keys:
+                    seen_keys.add(key)
+                    listings.append(listing)
+        finally:
+            # Stops the prefetch thread and releases the dataset iterator if normalisation failed.
+            records.close()
 
-        return self._deduplicate_listings(normalized_listings)
+        return listings
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -117,84 +404,84 @@ class RealtorScraperService:
     def _wait_for_dataset_ready(
         self,
         client: ApifyClient,
-        dataset_id: str,
+        run: Dict[str, Any],
         timeout_ms: int,
-        poll_interval_sec: int = 5,
+        base_delay_sec: float = 1.0,
+        max_delay_sec: float = 15.0,
     ) -> None:
-        deadline = time.time() + (timeout_ms / 1000)
-        dataset_client = client.dataset(dataset_id)
+        """Block until the actor run reaches a terminal status or ``timeout_ms`` elapses.
+
+        Polls the run-status endpoint with jittered exponential backoff; a run that is
+        already finished (the usual case after ``call``) costs no request at all.
+        """
+
+        status = run.get("status")
+        run_id = run.get("id")
+        deadline = time.monotonic() + (timeout_ms / 1000)
+        run_client = client.run(run_id) if run_id else None
+        attempt = 0
+
+        while status not in TERMINAL_RUN_STATUSES and run_client is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.warning("Timed out waiting for Apify run %s to finish", run_id)
+                return
+
+            delay = min(max_delay_sec, base_delay_sec * 2**attempt)
+            time.sleep(min(remaining, delay + random.uniform(0, 0.25 * delay)))
+            attempt += 1
 
-        while time.time() < deadline:
             try:
-                response = dataset_client.list_items(limit=1, clean=True)
+                details = run_client.get()
             except Exception as exc:  # pragma: no cover - network failures
-                self.logger.warning("Waiting for dataset readiness failed: %%s", exc)
-                time.sleep(poll_interval_sec)
+                self.logger.warning("Polling Apify run status failed: %s", exc)
                 continue
+            status = details.get("status") if isinstance(details, dict) else None
 
-            total = response.get("total")
-            items = response.get("items")
-            if (isinstance(total, int) and total > 0) or (isinstance(items, list) and items):
-                return
-
-            time.sleep(poll_interval_sec)
-
-        self.logger.warning("Timed out waiting for Apify dataset %s to become ready", dataset_id)
+        if status != "SUCCEEDED":
+            self.logger.warning("Apify run %s finished with status %s", run_id, status)
 
     def _collect_dataset_items(
         self,
         client: ApifyClient,
         dataset_id: str,
-        page_limit: int = 500,
-    ) -> List[Dict[str, Any]]:
-        dataset_client = client.dataset(dataset_id)
-        items: List[Dict[str, Any]] = []
-        offset = 0
-
-        while True:
-            response = dataset_client.list_items(limit=page_limit, offset=offset, clean=True)
-            page_items = response.get("items")
-            if not page_items:
-                break
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the run's dataset items so normalisation overlaps with paging.
 
-            items.extend(page_items)
-            offset += len(page_items)
+        Items are requested raw and cleaned here: hidden ``#`` fields (``#debug``,
+        ``#error``) are dropped along with records left empty, which is all that
+        Apify's server-side ``clean`` would have done for us.
+        """
 
-            total = response.get("total")
-            if isinstance(total, int) and offset >= total:
-                break
-
-        return items
+        raw_items = client.dataset(dataset_id).iterate_items(clean=False)
+        items: Iterator[Any] = filter(None, map(_strip_hidden_fields, raw_items))
+        if max_items is not None:
+            items = islice(items, max_items)
+        yield from items
 
     # ------------------------------------------------------------------
     # Normalisation helpers
     # ------------------------------------------------------------------
-    def _normalize_listing(self, raw: Any) -> Optional[Dict[str, Any]]:
+    def _normalize_listing(self, raw: Any) -> Optional[Listing]:
         if not isinstance(raw, dict):
             return None
 
-        location = self._first_dict(
-            raw.get("location"),
-            raw.get("address"),
-            raw.get("property", {}).get("address"),
-            raw.get("property", {}).get("location"),
-            raw.get("propertyLocation"),
-        )
-        location = location or {}
+        prop = self._first_dict(raw.get("property")) or {}
+        building = self._first_dict(raw.get("building")) or {}
+        location = self._find_location(raw, prop)
 
-        city = self._clean_string(
-            location.get("city")
-            or location.get("municipality")
-            or raw.get("city")
-            or raw.get("municipality")
-        )
+        city = self._find_city(raw, location)
+        if city:
+            # A scrape repeats a handful of city names; share one string per name.
+            city = sys.intern(city)
         province = self._clean_string(location.get("province") or location.get("state") or "ON")
         postal_code = self._clean_string(location.get("postalCode") or location.get("postal_code"))
         price_value = self._parse_price(
             raw.get("price")
             or raw.get("priceValue")
-            or raw.get("property", {}).get("price")
-            or raw.get("property", {}).get("priceValue")
+            or prop.get("price")
+            or prop.get("priceValue")
         )
         price_formatted = (
             self._format_price(price_value)
@@ -209,69 +496,94 @@ class RealtorScraperService:
         agents = self._extract_agents(raw)
         coordinates = self._extract_coordinates(raw)
 
-        listing = {
-            "id": raw.get("id")
+        return Listing(
+            id=raw.get("id")
             or raw.get("listingId")
             or raw.get("mlsId")
             or raw.get("mlsNumber")
-            or raw.get("property", {}).get("mlsNumber")
-            or raw.get("property", {}).get("id"),
-            "mlsNumber": self._clean_string(
+            or prop.get("mlsNumber")
+            or prop.get("id"),
+            mlsNumber=self._clean_string(
                 raw.get("mlsNumber")
                 or raw.get("mlsId")
-                or raw.get("property", {}).get("mlsNumber")
-                or raw.get("property", {}).get("mlsId")
+                or prop.get("mlsNumber")
+                or prop.get("mlsId")
                 or raw.get("listingId")
             ),
-            "address": self._format_address(location, raw),
-            "city": city,
-            "province": province,
-            "postalCode": postal_code,
-            "country": self._clean_string(location.get("country") or "Canada"),
-            "price": price_value,
-            "priceFormatted": price_formatted,
-            "priceText": self._clean_string(
+            address=self._format_address(location, raw),
+            city=city,
+            province=province,
+            postalCode=postal_code,
+            country=self._clean_string(location.get("country") or "Canada"),
+            price=price_value,
+            priceFormatted=price_formatted,
+            priceText=self._clean_string(
                 raw.get("price") or raw.get("priceLabel") or raw.get("displayPrice")
             ),
-            "propertyType": self._clean_string(
+            propertyType=self._clean_string(
                 raw.get("propertyType")
                 or raw.get("type")
-                or raw.get("property", {}).get("type")
+                or prop.get("type")
                 or raw.get("category")
-                or raw.get("building", {}).get("type")
+                or building.get("type")
             ),
-            "description": self._clean_string(
+            description=self._clean_string(
                 raw.get("description")
                 or raw.get("publicRemarks")
                 or raw.get("remarks")
-                or raw.get("property", {}).get("description")
-                or raw.get("property", {}).get("remarks")
+                or prop.get("description")
+                or prop.get("remarks")
             ),
-            "bedrooms": features.get("bedrooms"),
-            "bathrooms": features.get("bathrooms"),
-            "squareFeet": features.get("squareFeet"),
-            "lotSize": features.get("lotSize"),
-            "lotSizeText": features.get("lotSizeText"),
-            "yearBuilt": features.get("yearBuilt"),
-            "listingUrl": self._ensure_absolute_url(
+            bedrooms=features.get("bedrooms"),
+            bathrooms=features.get("bathrooms"),
+            squareFeet=features.get("squareFeet"),
+            lotSize=features.get("lotSize"),
+            lotSizeText=features.get("lotSizeText"),
+            yearBuilt=features.get("yearBuilt"),
+            listingUrl=self._ensure_absolute_url(
                 raw.get("url")
                 or raw.get("detailUrl")
                 or raw.get("detailPageUrl")
                 or raw.get("permalink")
-                or raw.get("property", {}).get("url")
+                or prop.get("url")
             ),
-            "images": images,
-            "agents": agents,
-            "brokerage": self._clean_string(
+            images=images,
+            agents=agents,
+            brokerage=self._clean_string(
                 raw.get("brokerage") or raw.get("officeName") or raw.get("office") or raw.get("broker")
             ),
-            "coordinates": coordinates,
-            "lastUpdated": raw.get("lastUpdated")
+            coordinates=coordinates,
+            lastUpdated=raw.get("lastUpdated")
             or raw.get("updated")
             or raw.get("lastUpdatedAt"),
-        }
+        )
+
+    def _find_location(self, raw: Dict[str, Any], prop: Dict[str, Any]) -> Dict[str, Any]:
+        location = self._first_dict(
+            raw.get("location"),
+            raw.get("address"),
+            prop.get("address"),
+            prop.get("location"),
+            raw.get("propertyLocation"),
+        )
+        return location or {}
+
+    def _find_city(self, raw: Dict[str, Any], location: Dict[str, Any]) -> Optional[str]:
+        return self._clean_string(
+            location.get("city")
+            or location.get("municipality")
+            or raw.get("city")
+            or raw.get("municipality")
+        )
 
-        return listing
+    def _peek_city(self, raw: Any) -> Optional[str]:
+        """Return the lower-cased city of a raw record without normalising the rest of it."""
+
+        if not isinstance(raw, dict):
+            return None
+        prop = self._first_dict(raw.get("property")) or {}
+        city = self._find_city(raw, self._find_location(raw, prop))
+        return city.lower() if city else None
 
     def _format_address(self, location: Dict[str, Any], raw: Dict[str, Any]) -> Optional[str]:
         if isinstance(raw.get("addressText"), str):
@@ -300,95 +612,34 @@ class RealtorScraperService:
         return ", ".join(parts) if parts else None
 
     def _extract_features(self, listing: Dict[str, Any]) -> Dict[str, Any]:
-        normalized_details = self._normalize_details(listing)
-
-        def get_detail_value(*keywords: str) -> Optional[Any]:
-            keyword_set = {keyword.lower() for keyword in keywords}
-            for detail in normalized_details:
-                label = detail.get("label", "").lower()
-                if any(keyword in label for keyword in keyword_set):
-                    return detail.get("value") or detail.get("text")
-            return None
+        detail_values: Optional[Dict[str, Any]] = None
 
-        bedrooms = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "bedrooms",
-                    "bedroomsTotal",
-                    "bedroomsAboveGround",
-                    "property.bedrooms",
-                    "property.building.bedrooms",
-                    "building.bedrooms",
-                    "building.bedroomsTotal",
-                    "summary.bedrooms",
-                ],
-            )
-        )
+        def get_detail_value(tag: str) -> Optional[Any]:
+            # Details are only indexed when a structured path lookup comes up empty.
+            nonlocal detail_values
+            if detail_values is None:
+                detail_values = self._index_details(listing)
+            return detail_values.get(tag)
+
+        bedrooms = self._extract_number(self._value_from_paths(listing, _BEDROOM_PATHS))
         if bedrooms is None:
-            bedrooms = self._extract_number(get_detail_value("bedroom", "bed"))
-
-        bathrooms = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "bathrooms",
-                    "bathroomsTotal",
-                    "property.bathrooms",
-                    "property.building.bathrooms",
-                    "building.bathrooms",
-                    "summary.bathrooms",
-                ],
-            )
-        )
+            bedrooms = self._extract_number(get_detail_value("bedrooms"))
+
+        bathrooms = self._extract_number(self._value_from_paths(listing, _BATHROOM_PATHS))
         if bathrooms is None:
-            bathrooms = self._extract_number(get_detail_value("bathroom", "bath"))
-
-        square_feet = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "sizeInterior",
-                    "building.sizeInterior",
-                    "building.totalFinishedArea",
-                    "property.building.sizeInterior",
-                    "property.squareFeet",
-                    "squareFootage",
-                    "area",
-                ],
-            )
-        )
+            bathrooms = self._extract_number(get_detail_value("bathrooms"))
+
+        square_feet = self._extract_number(self._value_from_paths(listing, _SQUARE_FEET_PATHS))
         if square_feet is None:
-            square_feet = self._extract_number(get_detail_value("square feet", "sqft", "interior"))
-
-        lot_size_raw = self._value_from_paths(
-            listing,
-            [
-                "land.sizeTotal",
-                "land.sizeTotalText",
-                "land.sizeFrontage",
-                "property.land.sizeTotal",
-                "lotSize",
-                "lotSizeArea",
-                "property.landSize",
-            ],
-        )
+            square_feet = self._extract_number(get_detail_value("squareFeet"))
+
+        lot_size_raw = self._value_from_paths(listing, _LOT_SIZE_PATHS)
         if lot_size_raw is None:
-            lot_size_raw = get_detail_value("lot size", "size total", "land size")
-
-        year_built = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "building.builtYear",
-                    "building.constructedDate",
-                    "property.building.builtYear",
-                    "property.building.constructedDate",
-                ],
-            )
-        )
+            lot_size_raw = get_detail_value("lotSize")
+
+        year_built = self._extract_number(self._value_from_paths(listing, _YEAR_BUILT_PATHS))
         if year_built is None:
-            year_built = self._extract_number(get_detail_value("built", "constructed", "year"))
+            year_built = self._extract_number(get_detail_value("yearBuilt"))
 
         return {
             "bedrooms": bedrooms,
@@ -399,10 +650,24 @@ class RealtorScraperService:
             "yearBuilt": year_built,
         }
 
+    def _index_details(self, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """Map each feature tag to the value of the first detail whose label mentions it."""
+
+        values: Dict[str, Any] = {}
+        for detail in self._normalize_details(listing):
+            label = detail.get("label")
+            label = label.lower() if isinstance(label, str) else str(label or "").lower()
+            for tag in _detail_tags(label):
+                if tag not in values:
+                    values[tag] = detail.get("value") or detail.get("text")
+            if len(values) == len(DETAIL_KEYWORDS):
+                break
+        return values
+
     def _normalize_details(self, listing: Dict[str, Any]) -> List[Dict[str, Any]]:
         collections: List[Iterable[Any]] = []
-        for path in ("details", "property.details", "propertyDetails", "building.details"):
-            value = self._get_path(listing, path)
+        for segments in _DETAIL_PATHS:
+            value = _get_segments(listing, segments)
             if isinstance(value, list):
                 collections.append(value)
 
@@ -428,77 +693,62 @@ class RealtorScraperService:
 
         return normalized
 
-    def _value_from_paths(self, data: Dict[str, Any], paths: List[str]) -> Any:
-        for path in paths:
-            value = self._get_path(data, path)
+    def _value_from_paths(self, data: Dict[str, Any], paths: PathSet) -> Any:
+        for segments in paths:
+            value = _get_segments(data, segments)
             if value not in (None, ""):
                 return value
         return None
 
-    def _get_path(self, data: Any, path: str) -> Any:
-        current = data
-        for segment in path.split("."):
-            if isinstance(current, dict) and segment in current:
-                current = current[segment]
-            else:
-                return None
-        return current
-
     def _extract_number(self, value: Any) -> Optional[float]:
         if value is None:
             return None
         if isinstance(value, (int, float)):
             return value if math.isfinite(float(value)) else None
         if isinstance(value, str):
-            normalized = re.sub(r"[^0-9.,-]+", "", value)
-            match = re.search(r"-?\d+(?:[.,]\d+)?", normalized)
-            if match:
-                try:
-                    return float(match.group(0).replace(",", ""))
-                except ValueError:
-                    return None
+            return _number_from_text(value)
         return None
 
     def _extract_images(self, listing: Dict[str, Any]) -> List[str]:
-        image_set: "set[str]" = set()
-
-        def add_image(url: Any) -> None:
-            cleaned = self._clean_string(url)
-            if not cleaned:
-                return
-            if cleaned.startswith("http://") or cleaned.startswith("https://"):
-                image_set.add(cleaned)
-            else:
-                prefix = "" if cleaned.startswith("/") else "/"
-                image_set.add(f"{BASE_REALTOR_URL}{prefix}{cleaned}")
-
-        candidate_arrays = [
+        candidates: List[Any] = []
+        for candidate in (
             listing.get("images"),
             listing.get("photos"),
             listing.get("media"),
             listing.get("gallery"),
-            self._get_path(listing, "property.photos"),
-            self._get_path(listing, "property.images"),
-            self._get_path(listing, "property.media"),
-            self._get_path(listing, "property.photo.highResPaths"),
-            self._get_path(listing, "property.photo.lowResPaths"),
-            self._get_path(listing, "property.photo.url"),
-        ]
-
-        for candidate in candidate_arrays:
+            _get_segments(listing, ("property", "photos")),
+            _get_segments(listing, ("property", "images")),
+            _get_segments(listing, ("property", "media")),
+            _get_segments(listing, ("property", "photo", "highResPaths")),
+            _get_segments(listing, ("property", "photo", "lowResPaths")),
+            _get_segments(listing, ("property", "photo", "url")),
+        ):
             if isinstance(candidate, str):
-                add_image(candidate)
+                candidates.append(candidate)
             elif isinstance(candidate, (list, tuple)):
-                for item in candidate:
-                    add_image(item)
+                candidates.extend(candidate)
             elif isinstance(candidate, dict):
-                for item in candidate.values():
-                    add_image(item)
+                candidates.extend(candidate.values())
 
-        return list(image_set)
+        # Keyed by canonical URL so a photo's other sizes are dropped; the first one seen wins.
+        images: Dict[str, str] = {}
+        for candidate in candidates:
+            cleaned = self._clean_string(candidate)
+            if not cleaned:
+                continue
+            if cleaned.startswith(("http://", "https://")):
+                url = cleaned
+            elif cleaned.startswith("/"):
+                url = BASE_REALTOR_URL + cleaned
+            else:
+                url = _BASE_REALTOR_URL_WITH_SLASH + cleaned
+            images.setdefault(_canonical_image_key(url), url)
+
+        return list(images.values())
 
     def _extract_agents(self, listing: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
         agents: List[Dict[str, Optional[str]]] = []
+        seen_keys: Set[str] = set()
 
         def push_agent(agent: Any) -> None:
             if not isinstance(agent, dict):
@@ -527,20 +777,23 @@ class RealtorScraperService:
             title = self._clean_string(agent.get("title") or agent.get("position") or agent.get("role"))
 
             if name or phone or email or brokerage:
-                agents.append(
-                    {"name": name, "phone": phone, "email": email, "brokerage": brokerage, "title": title}
-                )
+                key = self._agent_key(name, email, phone, brokerage)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    agents.append(
+                        {"name": name, "phone": phone, "email": email, "brokerage": brokerage, "title": title}
+                    )
 
         candidate_collections = [
             listing.get("agents"),
             listing.get("agent"),
-            self._get_path(listing, "property.agents"),
-            self._get_path(listing, "property.agent"),
-            self._get_path(listing, "property.representatives"),
+            _get_segments(listing, ("property", "agents")),
+            _get_segments(listing, ("property", "agent")),
+            _get_segments(listing, ("property", "representatives")),
             listing.get("contact"),
             listing.get("representatives"),
-            self._get_path(listing, "brokerage.agents"),
-            self._get_path(listing, "office.agents"),
+            _get_segments(listing, ("brokerage", "agents")),
+            _get_segments(listing, ("office", "agents")),
         ]
 
         for collection in candidate_collections:
@@ -568,52 +821,15 @@ class RealtorScraperService:
                     }
                 )
 
-        return self._deduplicate_agents(agents)
+        return agents
 
-    def _deduplicate_agents(self, agents: List[Dict[str, Optional[str]]]) -> List[Dict[str, Optional[str]]]:
-        unique: Dict[str, Dict[str, Optional[str]]] = {}
-        for agent in agents:
-            key_parts = [agent.get("name"), agent.get("email"), agent.get("phone"), agent.get("brokerage")]
-            key = "|".join(part.lower() for part in key_parts if isinstance(part, str))
-            if key not in unique:
-                unique[key] = agent
-        return list(unique.values())
+    @staticmethod
+    def _agent_key(*parts: Optional[str]) -> str:
+        return "|".join(part.lower() for part in parts if isinstance(part, str))
 
     def _extract_coordinates(self, listing: Dict[str, Any]) -> Optional[Dict[str, float]]:
-        lat = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "coordinates.lat",
-                    "coordinates.latitude",
-                    "location.lat",
-                    "location.latitude",
-                    "property.location.lat",
-                    "property.location.latitude",
-                    "geo.lat",
-                    "geo.latitude",
-                ],
-            )
-        )
-        lng = self._extract_number(
-            self._value_from_paths(
-                listing,
-                [
-                    "coordinates.lng",
-                    "coordinates.lon",
-                    "coordinates.longitude",
-                    "location.lng",
-                    "location.lon",
-                    "location.longitude",
-                    "property.location.lng",
-                    "property.location.lon",
-                    "property.location.longitude",
-                    "geo.lng",
-                    "geo.lon",
-                    "geo.longitude",
-                ],
-            )
-        )
+        lat = self._extract_number(self._value_from_paths(listing, _LATITUDE_PATHS))
+        lng = self._extract_number(self._value_from_paths(listing, _LONGITUDE_PATHS))
 
         if lat is not None and lng is not None:
             return {"lat": float(lat), "lng": float(lng)}
@@ -623,23 +839,19 @@ class RealtorScraperService:
         cleaned = self._clean_string(url)
         if not cleaned:
             return None
-        if re.match(r"^https?://", cleaned, flags=re.IGNORECASE):
+        if _ABSOLUTE_URL_RE.match(cleaned):
             return cleaned
         prefix = "" if cleaned.startswith("/") else "/"
         return f"{BASE_REALTOR_URL}{prefix}{cleaned}"
 
-    def _deduplicate_listings(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        unique: Dict[str, Dict[str, Any]] = {}
-        for listing in listings:
-            key_candidates = [
-                listing.get("mlsNumber"),
-                listing.get("listingUrl"),
-                listing.get("address"),
-            ]
-            key = next((str(candidate).lower() for candidate in key_candidates if candidate), None)
-            if key and key not in unique:
-                unique[key] = listing
-        return list(unique.values())
+    @staticmethod
+    def _listing_key(listing: Listing) -> Optional[str]:
+        """Identity used to drop duplicate listings; ``None`` when nothing identifies it."""
+
+        for candidate in (listing.mlsNumber, listing.listingUrl, listing.address):
+            if candidate:
+                return str(candidate).lower()
+        return None
 
     # ------------------------------------------------------------------
     # Utility helpers
@@ -649,7 +861,8 @@ class RealtorScraperService:
         if value is None:
             return None
         if isinstance(value, str):
-            cleaned = " ".join(value.replace("\xa0", " ").split())
+            # str.split() already treats non-breaking spaces as whitespace.
+            cleaned = " ".join(value.split())
             return cleaned or None
         if isinstance(value, (int, float)):
             if isinstance(value, float) and not math.isfinite(value):
@@ -673,13 +886,7 @@ class RealtorScraperService:
                     return RealtorScraperService._parse_price(value[key])
             return None
         if isinstance(value, str):
-            normalized = re.sub(r"[^0-9.,-]+", "", value)
-            match = re.search(r"-?\d+(?:[.,]\d+)?", normalized)
-            if match:
-                try:
-                    return float(match.group(0).replace(",", ""))
-                except ValueError:
-                    return None
+            return _number_from_text(value)
         return None
 
     @staticmethod
@@ -699,12 +906,16 @@ class RealtorScraperService:
         return None
 
 
-def serialize_scrape_response(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Build a JSON serialisable response payload for the API."""
+def serialize_scrape_response(properties: List[Listing]) -> Dict[str, Any]:
+    """Build a JSON serialisable response payload for the API.
+
+    ``Listing`` dataclasses and their plain ``str``/``float``/``dict``/``list`` values
+    serialise natively with both ``orjson.dumps`` and ``jsonify``.
+    """
 
     return {
         "properties": properties,
-        "lastUpdated": datetime.now(timezone.utc).isoformat(),
+        "lastUpdated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "source": "apify",
     }
 
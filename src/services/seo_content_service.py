@@ -2,27 +2,209 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import os
 import random
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-import textstat
-from textblob import TextBlob
+import requests
+from requests.adapters import HTTPAdapter
 
-try:  # language_tool_python may require a remote server – only load when available
-    import language_tool_python  # type: ignore
+try:  # orjson is optional – fall back to the stdlib codec when it is not installed
+    import orjson  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
-    language_tool_python = None
+    orjson = None
+
+try:  # pyahocorasick is optional – keyword counting falls back to one regex per keyword
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
 LOGGER = logging.getLogger(__name__)
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 DATA_DIR = os.path.join(BASE_DIR, "data")
+# Distinct texts remembered by the cached text analysers and per-service score caches.
+TEXT_CACHE_SIZE = 512
+# LanguageTool servers check up to ``maxCheckThreads`` (10 by default) texts at once.
+MAX_GRAMMAR_WORKERS = 8
+# (connect, read) seconds for LanguageTool server requests.
+GRAMMAR_REQUEST_TIMEOUT = (3.05, 10)
+# Lets an embedded LanguageTool server reuse results and analysis pipelines between checks.
+LOCAL_GRAMMAR_CONFIG = {"cacheSize": "1000", "pipelineCaching": "true"}
+
+# Opinion words seen in listing and market copy; polarity only needs to be roughly right.
+POSITIVE_WORDS = frozenset(
+    {
+        "amazing",
+        "beautiful",
+        "best",
+        "bright",
+        "charming",
+        "desirable",
+        "excellent",
+        "fantastic",
+        "gorgeous",
+        "great",
+        "happy",
+        "ideal",
+        "incredible",
+        "love",
+        "lovely",
+        "perfect",
+        "spacious",
+        "strong",
+        "stunning",
+        "welcoming",
+        "wonderful",
+    }
+)
+NEGATIVE_WORDS = frozenset(
+    {
+        "awful",
+        "bad",
+        "cramped",
+        "damaged",
+        "declining",
+        "difficult",
+        "dated",
+        "noisy",
+        "poor",
+        "problem",
+        "risky",
+        "terrible",
+        "weak",
+        "worst",
+    }
+)
+_WORD_RE = re.compile(r"[a-z]+")
+# Readability counts words with their contractions ("don't") and sentences by their terminators.
+_READING_WORD_RE = re.compile(r"[a-z]+(?:['’][a-z]+)*")
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+# A final "e" is silent ("home", "smile") unless it ends "ee" or a consonant + "le" ("table").
+_SILENT_E_RE = re.compile(r"(?:[^el]|[aeiouy]l)e$")
+
+
+# Parsed JSON files by path, with the (mtime_ns, size) they were read at. Entries are shared
+# between services, so the parsed data must be treated as read-only.
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_json_cached(path: str) -> Any:
+    """Parse the JSON file at ``path``, reusing the last result while the file is unchanged."""
+
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _JSON_CACHE[path] = (signature, data)
+    return data
+
+
+def _build_grammar_session() -> requests.Session:
+    """Keep-alive session sized for concurrent checks against a LanguageTool server."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_GRAMMAR_WORKERS, pool_maxsize=MAX_GRAMMAR_WORKERS * 2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _word_pattern(term: str) -> "re.Pattern[str]":
+    """Compile a whole-word matcher for ``term``, to be run against lower-cased text."""
+
+    return re.compile(r"\b" + re.escape(term.lower()) + r"\b")
+
+
+@dataclass(frozen=True, slots=True)
+class _ContentFeatures:
+    """Measurements of one text shared by every scorer that looks at it."""
+
+    lower: str
+    word_count: int
+    length: int
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _featurize(content: str) -> _ContentFeatures:
+    lower = content.lower()
+    return _ContentFeatures(lower=lower, word_count=len(lower.split()), length=len(content))
+
+
+@lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """Estimate syllables in a lower-cased word from its vowel groups."""
+
+    syllables = len(_VOWEL_GROUP_RE.findall(word))
+    if syllables > 1 and _SILENT_E_RE.search(word):
+        syllables -= 1
+    return max(syllables, 1)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _flesch_reading_ease(content: str) -> float:
+    """Flesch reading ease of ``content``, computed in one pass over its words."""
+
+    lower = _featurize(content).lower
+    words = _READING_WORD_RE.findall(lower)
+    if not words:
+        return 0.0
+    sentences = max(1, sum(1 for part in _SENTENCE_END_RE.split(lower) if _READING_WORD_RE.search(part)))
+    syllables = sum(_count_syllables(word) for word in words)
+    score = 206.835 - 1.015 * (len(words) / sentences) - 84.6 * (syllables / len(words))
+    return round(score, 2)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _sentiment_polarity(content: str) -> float:
+    """Polarity in ``[-1, 1]``: the balance of positive over negative opinion words."""
+
+    positive = negative = 0
+    for word in _WORD_RE.findall(content.lower()):
+        if word in POSITIVE_WORDS:
+            positive += 1
+        elif word in NEGATIVE_WORDS:
+            negative += 1
+    return (positive - negative) / max(1, positive + negative)
+
+
+def _clear_text_caches() -> None:
+    for cached in (_featurize, _flesch_reading_ease, _sentiment_polarity):
+        cached.cache_clear()
+
+
+def _remember(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+    """Store ``value`` in ``cache``, evicting the oldest entry once it holds ``TEXT_CACHE_SIZE``."""
+
+    if len(cache) >= TEXT_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Mirror ``re``'s ``\\b``: a word character on exactly one side of ``index``."""
+
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
 
 
 class SEOContentService:
@@ -35,25 +217,18 @@ class SEOContentService:
         self.refresh_trend_scores()
         self.default_region = "Windsor-Essex, Ontario"
 
+        self._seo_score_cache: Dict[Tuple[str, str, str], Tuple[float, float, int]] = {}
+        self._grammar_cache: Dict[str, int] = {}
         self._grammar_tool = None
-        self._grammar_check_enabled = False
-        if (
-            os.getenv("ENABLE_GRAMMAR_CHECK", "").lower() in {"1", "true", "yes"}
-            and language_tool_python is not None
-        ):
-            try:
-                tool_url = os.getenv("LANGUAGETOOL_URL")
-                if tool_url:
-                    self._grammar_tool = language_tool_python.LanguageTool(
-                        "en-US", config={"url": tool_url}
-                    )
-                else:
-                    self._grammar_tool = language_tool_python.LanguageTool("en-US")
-                self._grammar_check_enabled = True
-            except Exception as exc:  # pragma: no cover - depends on environment
-                LOGGER.warning("Grammar checking disabled: %s", exc)
-                self._grammar_tool = None
-                self._grammar_check_enabled = False
+        self._grammar_session: Optional[requests.Session] = None
+        self._grammar_url: Optional[str] = None
+        self._grammar_check_enabled = os.getenv("ENABLE_GRAMMAR_CHECK", "").lower() in {"1", "true", "yes"}
+        tool_url = os.getenv("LANGUAGETOOL_URL")
+        if self._grammar_check_enabled and tool_url:
+            # A running LanguageTool server is called directly over a pooled session.
+            self._grammar_url = tool_url.rstrip("/") + "/v2/check"
+            self._grammar_session = _build_grammar_session()
+        # Otherwise the embedded LanguageTool, which launches a JVM, starts on the first check.
 
         self.content_templates = {
             "property_showcase": {
@@ -150,16 +325,37 @@ class SEOContentService:
     # Configuration and content generation helpers
     # ------------------------------------------------------------------
     def _load_config(self) -> None:
-        with open(self.config_path, "r", encoding="utf-8") as fh:
-            config = json.load(fh)
+        config = _load_json_cached(self.config_path)
 
         self.location_keywords = config.get("location_keywords", {})
         self.real_estate_keywords = config.get("real_estate_keywords", {})
         self.hashtag_strategies = config.get("hashtag_strategies", {})
         self.hashtags = config.get("hashtags", {})
+        # Keyword matchers are built once per config load rather than on every scoring call.
+        self._keywords: List[Tuple[str, str]] = [
+            (keyword, keyword.lower())
+            for keywords in self.real_estate_keywords.values()
+            for keyword in keywords
+        ]
+        self._keyword_patterns: Dict[str, "re.Pattern[str]"] = {
+            key: _word_pattern(key) for _, key in self._keywords
+        }
+        self._keyword_automaton = None
+        if ahocorasick is not None and self._keyword_patterns:
+            automaton = ahocorasick.Automaton()
+            for key in self._keyword_patterns:
+                if key:
+                    automaton.add_word(key, key)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
 
     def reload_config(self) -> None:
         self._load_config()
+        # Scores depend on the keyword configuration; the text analysers are pure but are
+        # dropped too so a reload also bounds their memory.
+        self._seo_score_cache.clear()
+        self._grammar_cache.clear()
+        _clear_text_caches()
 
     def refresh_trend_scores(self, source: Optional[str] = None) -> None:
         try:
@@ -169,9 +365,7 @@ class SEOContentService:
                 with urlopen(source) as response:  # nosec B310
                     data = json.loads(response.read().decode())
             else:
-                default_path = source or os.path.join(DATA_DIR, "trend_scores.json")
-                with open(default_path, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                data = _load_json_cached(source or os.path.join(DATA_DIR, "trend_scores.json"))
             self.trend_scores = {k: float(v) for k, v in data.items()}
         except Exception:
             self.trend_scores = getattr(self, "trend_scores", {})
@@ -334,22 +528,12 @@ class SEOContentService:
         min_count, max_count = strategy.get("count", (8, 12))
         target_count = random.randint(min_count, max_count)
 
-        def weighted_sample(tags: List[str], count: int) -> List[str]:
-            available = tags[:]
-            weights = [self.trend_scores.get(tag, 1.0) for tag in available]
-            chosen: List[str] = []
-            for _ in range(min(count, len(available))):
-                selection = random.choices(available, weights=weights, k=1)[0]
-                idx = available.index(selection)
-                chosen.append(selection)
-                del available[idx]
-                del weights[idx]
-            return chosen
-
         selected_hashtags: List[str] = []
-        selected_hashtags.extend(weighted_sample(self.hashtags.get("high_volume", []), target_count // 3))
-        selected_hashtags.extend(weighted_sample(self.hashtags.get("medium_volume", []), target_count // 3))
-        selected_hashtags.extend(weighted_sample(self.hashtags.get("niche", []), target_count - len(selected_hashtags)))
+        selected_hashtags.extend(self._weighted_sample(self.hashtags.get("high_volume", []), target_count // 3))
+        selected_hashtags.extend(self._weighted_sample(self.hashtags.get("medium_volume", []), target_count // 3))
+        selected_hashtags.extend(
+            self._weighted_sample(self.hashtags.get("niche", []), target_count - len(selected_hashtags))
+        )
 
         location_clean = location.split(",")[0].replace(" ", "").replace("-", "")
         location_hashtags = [f"#{location_clean}", f"#{location_clean}RealEstate"]
@@ -368,6 +552,21 @@ class SEOContentService:
         all_hashtags.sort(key=lambda tag: self.trend_scores.get(tag, 1.0), reverse=True)
         return all_hashtags[:target_count]
 
+    def _weighted_sample(self, tags: List[str], count: int) -> List[str]:
+        """Pick up to ``count`` tags without replacement, weighted by trend score.
+
+        Efraimidis–Spirakis sampling: each tag draws ``u ** (1 / weight)`` and the largest
+        keys win, which matches repeated weighted draws in a single pass.
+        """
+
+        if count <= 0:
+            return []
+
+        def key(tag: str) -> float:
+            return random.random() ** (1.0 / max(self.trend_scores.get(tag, 1.0), 1e-9))
+
+        return heapq.nlargest(count, tags, key=key)
+
     def _generate_image_prompt(self, content_type: str, location: str, custom_data: Dict) -> str:
         base_prompts = {
             "property_showcase": [
@@ -423,89 +622,179 @@ class SEOContentService:
         return target_time.strftime("%Y-%m-%d %H:%M:%S")
 
     def _generate_seo_metadata(self, content: str, location: str, content_type: str) -> Dict:
-        content_lower = content.lower()
-        words = content_lower.split()
-        total_words = len(words)
+        features = _featurize(content)
+        total_words = features.word_count
 
+        keyword_counts = self._count_keywords(features.lower)
         keyword_density: Dict[str, float] = {}
         total_keyword_occurrences = 0
-        for category, keywords in self.real_estate_keywords.items():
-            for keyword in keywords:
-                pattern = r"\\b" + re.escape(keyword.lower()) + r"\\b"
-                count = len(re.findall(pattern, content_lower))
-                if count > 0 and total_words > 0:
-                    density = (count / total_words) * 100
-                    keyword_density[keyword] = round(density, 2)
-                    total_keyword_occurrences += count
+        for keyword, key in self._keywords:
+            count = keyword_counts[key]
+            if count > 0 and total_words > 0:
+                density = (count / total_words) * 100
+                keyword_density[keyword] = round(density, 2)
+                total_keyword_occurrences += count
 
         meta_description = f"Real estate content for {location}. {content[:100]}..."
-        seo_score, sentiment, grammar_errors = self._calculate_seo_score(content, location, content_type)
+        readability_score = self._calculate_readability_score(content)
+        seo_score, sentiment, grammar_errors = self._calculate_seo_score(
+            content,
+            location,
+            content_type,
+            keyword_occurrences=total_keyword_occurrences,
+            readability=readability_score,
+        )
 
         return {
             "keyword_density": keyword_density,
             "meta_description": meta_description,
             "primary_keywords": list(keyword_density.keys())[:5],
-            "location_mentions": len(re.findall(r"\\b" + re.escape(location.lower()) + r"\\b", content_lower)),
+            "location_mentions": len(_word_pattern(location).findall(features.lower)),
             "seo_score": seo_score,
-            "content_length": len(content),
-            "readability_score": self._calculate_readability_score(content),
+            "content_length": features.length,
+            "readability_score": readability_score,
             "sentiment_polarity": sentiment,
             "grammar_errors": grammar_errors,
             "overall_keyword_density": round((total_keyword_occurrences / total_words) * 100, 2) if total_words else 0,
         }
 
-    def _calculate_seo_score(self, content: str, location: str, content_type: str) -> Tuple[float, float, int]:
+    def _calculate_seo_score(
+        self,
+        content: str,
+        location: str,
+        content_type: str,
+        *,
+        keyword_occurrences: Optional[int] = None,
+        readability: Optional[float] = None,
+    ) -> Tuple[float, float, int]:
+        """Score ``content``; callers that already measured it can pass those measurements in.
+
+        Results are cached per ``(content, location, content_type)``, so the repeated
+        scoring of one post by metadata, engagement and optimisation runs only once.
+        """
+
+        cache_key = (content, location, content_type)
+        cached = self._seo_score_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         score = 0.0
-        content_lower = content.lower()
-        words = content_lower.split()
-        total_words = len(words)
+        features = _featurize(content)
+        content_lower = features.lower
+        total_words = features.word_count
 
         if location.lower() in content_lower:
             score += 20
 
-        keyword_occurrences = 0
-        for keywords in self.real_estate_keywords.values():
-            for keyword in keywords:
-                keyword_occurrences += len(re.findall(r"\\b" + re.escape(keyword.lower()) + r"\\b", content_lower))
+        if keyword_occurrences is None:
+            keyword_counts = self._count_keywords(content_lower)
+            keyword_occurrences = sum(keyword_counts[key] for _, key in self._keywords)
         keyword_density = (keyword_occurrences / total_words) * 100 if total_words else 0
         score += max(0, 30 - abs(keyword_density - 2) * 15)
 
-        readability = textstat.flesch_reading_ease(content)
+        if readability is None:
+            readability = self._calculate_readability_score(content)
         score += max(min(readability, 100), 0) * 0.2
 
-        polarity = TextBlob(content).sentiment.polarity
+        polarity = _sentiment_polarity(content)
         score += polarity * 10
 
         grammar_errors = self._count_grammar_errors(content)
         score -= min(grammar_errors * 2, 20)
 
-        content_length = len(content)
-        if 50 <= content_length <= 300:
+        if 50 <= features.length <= 300:
             score += 10
 
-        final_score = max(min(score, 100.0), 0.0)
-        return final_score, polarity, grammar_errors
+        result = (max(min(score, 100.0), 0.0), polarity, grammar_errors)
+        _remember(self._seo_score_cache, cache_key, result)
+        return result
+
+    def _count_keywords(self, content_lower: str) -> Counter:
+        """Count whole-word occurrences of each configured keyword, keyed by its lower-cased form.
+
+        With pyahocorasick every keyword is found in one pass over the content; matches
+        that are not on word boundaries, or that overlap an earlier match of the same
+        keyword, are skipped so the counts equal ``re.findall`` with ``\\b`` anchors.
+        """
+
+        counts: Counter = Counter()
+        if self._keyword_automaton is None:
+            for key, pattern in self._keyword_patterns.items():
+                counts[key] = len(pattern.findall(content_lower))
+            return counts
+
+        next_start: Dict[str, int] = {}
+        for end, key in self._keyword_automaton.iter(content_lower):
+            start = end - len(key) + 1
+            if start < next_start.get(key, 0):
+                continue
+            if _is_word_boundary(content_lower, start) and _is_word_boundary(content_lower, end + 1):
+                counts[key] += 1
+                next_start[key] = end + 1
+        return counts
+
+    def _check_grammar(self, content: str) -> int:
+        if self._grammar_session is not None:
+            response = self._grammar_session.post(
+                self._grammar_url,
+                data={"text": content, "language": "en-US"},
+                timeout=GRAMMAR_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            return len(response.json().get("matches", []))
+        if self._grammar_tool is None:
+            self._grammar_tool = self._start_local_grammar_tool()
+        return len(self._grammar_tool.check(content))
+
+    @staticmethod
+    def _start_local_grammar_tool():
+        import language_tool_python  # type: ignore  # deferred: only needed once grammar is checked
+
+        return language_tool_python.LanguageTool("en-US", config=LOCAL_GRAMMAR_CONFIG)
+
+    def _disable_grammar_check(self, exc: Exception) -> None:
+        LOGGER.warning("Disabling grammar checking after failure: %s", exc)
+        self._grammar_tool = None
+        self._grammar_session = None
+        self._grammar_check_enabled = False
 
     def _count_grammar_errors(self, content: str) -> int:
-        if not self._grammar_check_enabled or self._grammar_tool is None:
+        if not self._grammar_check_enabled:
             return 0
+        cached = self._grammar_cache.get(content)
+        if cached is not None:
+            return cached
         try:
-            return len(self._grammar_tool.check(content))
+            errors = self._check_grammar(content)
         except Exception as exc:  # pragma: no cover - relies on external service
-            LOGGER.warning("Disabling grammar checking after failure: %s", exc)
-            self._grammar_tool = None
-            self._grammar_check_enabled = False
+            self._disable_grammar_check(exc)
             return 0
+        _remember(self._grammar_cache, content, errors)
+        return errors
+
+    def _warm_grammar_cache(self, texts: List[str]) -> None:
+        """Check uncached ``texts`` concurrently against a LanguageTool server and cache the counts."""
+
+        if self._grammar_session is None:
+            return
+        pending = [text for text in dict.fromkeys(texts) if text not in self._grammar_cache]
+        if len(pending) <= 1:
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_GRAMMAR_WORKERS, len(pending))) as executor:
+            try:
+                # Workers only make requests; results are cached on this thread.
+                for text, errors in zip(pending, executor.map(self._check_grammar, pending)):
+                    _remember(self._grammar_cache, text, errors)
+            except Exception as exc:  # pragma: no cover - relies on external service
+                self._disable_grammar_check(exc)
 
     @staticmethod
     def _calculate_readability_score(content: str) -> float:
-        try:
-            return textstat.flesch_reading_ease(content)
-        except Exception:
-            return 0.0
+        return _flesch_reading_ease(content)
 
     def _calculate_engagement_score(self, content: str, hashtags: List[str], platform: str) -> float:
         score = 0.0
+        features = _featurize(content)
         seo_score, _, _ = self._calculate_seo_score(content, self.default_region, "general")
         score += (seo_score / 100) * 40
 
@@ -521,17 +810,17 @@ class SEOContentService:
             score += max(30 - (distance * 5), 0)
 
         if platform == "instagram":
-            if any(word in content.lower() for word in ["photo", "image", "see", "look", "view"]):
+            if any(word in features.lower for word in ["photo", "image", "see", "look", "view"]):
                 score += 10
-            if len(content) <= 300:
+            if features.length <= 300:
                 score += 10
         else:
-            if len(content) >= 100:
+            if features.length >= 100:
                 score += 10
             if "?" in content:
                 score += 10
 
-        if any(cta in content.lower() for cta in ["dm", "message", "contact", "comment", "share", "tag"]):
+        if any(cta in features.lower for cta in ["dm", "message", "contact", "comment", "share", "tag"]):
             score += 10
 
         return min(score, 100.0)
@@ -610,13 +899,18 @@ class SEOContentService:
         evaluations: List[Dict] = []
         suggestion_counter: Counter = Counter()
 
+        candidates = []
         for post in posts:
             if not isinstance(post, dict):
                 continue
             text = post.get("content") or post.get("text") or post.get("caption")
-            if not text:
-                continue
+            if text:
+                candidates.append((post, text))
+        if self._grammar_check_enabled:
+            # Check every post up front so remote checks overlap instead of running one by one.
+            self._warm_grammar_cache([text for _, text in candidates])
 
+        for post, text in candidates:
             platform = post.get("platform", default_platform)
             location = post.get("location") or self.default_region
             content_type = post.get("content_type", "general")
@@ -711,7 +1005,8 @@ class SEOContentService:
     def optimize_existing_content(self, content: str, platform: str = "instagram") -> Dict:
         current_score, _, _ = self._calculate_seo_score(content, self.default_region, "general")
         suggestions: List[str] = []
-        content_lower = content.lower()
+        features = _featurize(content)
+        content_lower = features.lower
 
         location_mentioned = any(loc.lower() in content_lower for loc in self.location_keywords.get("primary", []))
         if not location_mentioned:
@@ -729,9 +1024,9 @@ class SEOContentService:
         if not cta_present:
             suggestions.append("Add a clear call-to-action")
 
-        if len(content) < 50:
+        if features.length < 50:
             suggestions.append("Expand content for better engagement (aim for 100-300 characters)")
-        elif len(content) > 500:
+        elif features.length > 500:
             suggestions.append("Consider shortening content for better readability")
 
         optimized_hashtags = self._generate_hashtags("general", platform, self.default_region)
@@ -0,0 +1,102 @@
+from src.services.learning_algorithm_service import LearningAlgorithmService
+
+
+def _content(content_id, likes=0, uploaded_at="2024-05-01T14:00:00", **extra):
+    item = {
+        "id": content_id,
+        "text": f"Post {content_id}",
+        "uploaded_at": uploaded_at,
+        "engagement": {"likes": likes},
+    }
+    item.update(extra)
+    return item
+
+
+def test_update_performance_history_merges_existing_posts():
+    service = LearningAlgorithmService()
+    service.update_performance_history(service.fetch_post_performance(content_items=[_content("a", likes=1)]))
+    service.update_performance_history(
+        service.fetch_post_performance(content_items=[_content("a", likes=5), _content("b", likes=2)])
+    )
+
+    assert [entry.id for entry in service.performance_history] == ["a", "b"]
+    assert service.performance_history[0].metric("likes") == 5
+    assert service.performance_history[0].engagement_score == 5
+
+
+def test_update_performance_history_keeps_most_recent_window():
+    service = LearningAlgorithmService()
+    items = [_content(str(index)) for index in range(505)]
+    service.update_performance_history(service.fetch_post_performance(content_items=items))
+
+    assert len(service.performance_history) == 500
+    assert service.performance_history[0].id == "5"
+    assert "0" not in service._history_index
+
+
+def test_update_insights_ranks_hours_and_content_types():
+    service = LearningAlgorithmService()
+    items = [
+        _content("a", likes=2, uploaded_at="2024-05-01T09:00:00"),
+        _content("b", likes=4, uploaded_at="2024-05-02T09:30:00", content_type="image"),
+        _content("c", likes=10, uploaded_at="2024-05-03T18:00:00", engagement={"likes": 10, "shares": 1}),
+    ]
+    service.update_performance_history(service.fetch_post_performance(content_items=items))
+
+    insights = service.learning_insights
+    assert insights["optimal_posting_times"] == {18: 13.0, 9: 3.0}
+    assert list(insights["best_performing_content_types"]) == ["text", "image"]
+    assert insights["high_engagement_patterns"]["likes"] == 5.33
+    assert service.analyze_performance_patterns()["average_engagement"] == 6.33
+
+
+def test_fetch_post_performance_normalises_hashtags():
+    service = LearningAlgorithmService()
+    posts = service.fetch_post_performance(
+        content_items=[
+            _content("a", text="Open house in #Windsor this #weekend"),
+            _content("b", hashtags=["#Windsor"]),
+        ]
+    )
+
+    assert posts[0].hashtags == ["#windsor", "#weekend"]
+    assert posts[1].hashtags == ["#windsor"]
+
+
+def test_recommendations_default_to_best_content_type():
+    service = LearningAlgorithmService()
+    items = [_content(str(index), likes=index) for index in range(8)]
+    service.update_performance_history(service.fetch_post_performance(content_items=items))
+
+    recommendations = service.get_content_recommendations()
+    assert recommendations["recommended_content_type"] == "text"
+
+
+def test_created_times_are_utc_aware_and_window_recent_posts():
+    from datetime import datetime, timedelta, timezone
+
+    service = LearningAlgorithmService()
+    recent = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat().replace("+00:00", "Z")
+    items = [
+        _content("old", likes=100, uploaded_at="2020-01-01T10:00:00"),
+        _content("new", likes=4, uploaded_at=recent),
+    ]
+    posts = service.fetch_post_performance(content_items=items)
+    service.update_performance_history(posts)
+
+    assert all(post.created_time.tzinfo is timezone.utc for post in posts)
+    assert service.learning_insights["high_engagement_patterns"]["likes"] == 4
+
+
+def test_incremental_buckets_match_full_rebuild_after_updates_and_evictions():
+    service = LearningAlgorithmService()
+    first = [_content(str(index), likes=index % 7, uploaded_at=f"2024-05-01T{index % 24:02d}:00:00") for index in range(450)]
+    second = [_content(str(index), likes=3, hashtags=["#Windsor"]) for index in range(400, 520)]
+    service.update_performance_history(service.fetch_post_performance(content_items=first))
+    service.update_performance_history(service.fetch_post_performance(content_items=second))
+
+    rebuilt = LearningAlgorithmService()
+    rebuilt.update_performance_history(list(service.performance_history))
+
+    assert service.learning_insights == rebuilt.learning_insights
+    assert service.learning_insights["effective_hashtags"] == {"#windsor": 120}
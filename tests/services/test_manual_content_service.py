@@ -0,0 +1,379 @@
+import pytest
+
+from src.services.manual_content_service import ManualContentService
+
+
+def test_get_all_content_orders_by_upload_time(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "older", "text": "a", "uploaded_at": "2024-01-01T00:00:00Z"})
+    service.save_content({"id": "newer", "text": "b", "uploaded_at": "2024-02-01T00:00:00Z"})
+
+    assert [item["id"] for item in service.get_all_content()] == ["newer", "older"]
+    assert [item["id"] for item in service.get_all_content(limit=1)] == ["newer"]
+
+
+def test_get_all_content_treats_limit_as_slice_bound(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    for index in range(4):
+        service.save_content({"id": str(index), "text": "a", "uploaded_at": f"2024-01-0{index + 1}T00:00:00Z"})
+
+    assert [item["id"] for item in service.get_all_content(limit=None)] == ["3", "2", "1", "0"]
+    assert [item["id"] for item in service.get_all_content(limit=-1)] == ["3", "2", "1"]
+    assert service.get_all_content(limit=0) == []
+
+
+def test_cache_tracks_writes_from_other_instances(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    other = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "post", "text": "original"})
+    assert service.get_content("post")["text"] == "original"
+
+    other.update_content("post", {"text": "edited"})
+    assert service.get_content("post")["text"] == "edited"
+
+    other.delete_content("post")
+    assert service.get_all_content() == []
+    assert service.get_content("post") is None
+
+
+def test_cache_notices_same_size_replace_with_equal_mtime(tmp_path):
+    import os
+
+    service = ManualContentService(storage_path=tmp_path)
+    other = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "post", "text": "first", "uploaded_at": "2024-01-01T00:00:00Z"})
+    path = tmp_path / "post.json"
+    before = path.stat()
+
+    other.save_content({"id": "post", "text": "other", "uploaded_at": "2024-01-01T00:00:00Z"})
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert path.stat().st_size == before.st_size
+
+    assert service.get_content("post")["text"] == "other"
+
+
+def test_returned_items_do_not_alias_the_cache(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "post", "text": "hello #home", "hashtags": ["#home"], "engagement": {"likes": 1}})
+
+    service.get_all_content()[0]["manual_source"] = True
+    service.get_content("post")["hashtags"].append("#zzz")
+    service.search_content("hello")[0]["engagement"]["likes"] = 99
+
+    item = service.get_content("post")
+    assert "manual_source" not in item
+    assert item["hashtags"] == ["#home"]
+    assert item["engagement"] == {"likes": 1}
+    assert service.get_content_stats()["hashtag_usage"] == {"#home": 1}
+
+
+def test_large_payloads_round_trip(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    text = "Spacious family home " * 2000
+    service.save_content({"id": "large", "text": text})
+
+    fresh = ManualContentService(storage_path=tmp_path)
+    assert fresh.get_content("large")["text"] == text
+
+
+def test_bulk_reload_reads_every_file(tmp_path):
+    writer = ManualContentService(storage_path=tmp_path)
+    for index in range(40):
+        writer.save_content({"id": f"post-{index:02d}", "text": "x", "uploaded_at": f"2024-01-01T00:00:{index:02d}Z"})
+
+    reader = ManualContentService(storage_path=tmp_path)
+    items = reader.get_all_content(limit=100)
+
+    assert len(items) == 40
+    assert items[0]["id"] == "post-39"
+
+
+def test_mixed_timestamp_formats_sort_and_filter_consistently(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "offset", "text": "a", "uploaded_at": "2024-03-01T12:00:00+02:00"})
+    service.save_content({"id": "naive", "text": "b", "uploaded_at": "2024-03-01T11:00:00"})
+    service.save_content({"id": "zulu", "text": "c", "uploaded_at": "2024-03-01T09:30:00Z"})
+    service.save_content({"id": "broken", "text": "d", "uploaded_at": "not a date"})
+
+    assert [item["id"] for item in service.get_all_content()] == ["naive", "offset", "zulu", "broken"]
+
+    results = service.search_content("", {"date_from": "2024-03-01T10:00:00Z"})
+    assert [item["id"] for item in results] == ["naive", "offset"]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_call_to_action_and_sentiment_detection(tmp_path, monkeypatch, use_automaton):
+    from src.services import manual_content_service as module
+
+    if not use_automaton:
+        monkeypatch.setattr(module, "_CTA_AUTOMATON", None)
+    module._clear_text_caches()
+    service = ManualContentService(storage_path=tmp_path)
+
+    assert service._detect_call_to_action("Ready to move? DM me today!")
+    assert not service._detect_call_to_action("A quiet street with mature trees.")
+    assert service._analyze_basic_sentiment("An amazing, beautiful kitchen") == "positive"
+    assert service._analyze_basic_sentiment("The worst commute, a terrible yard, but great light") == "negative"
+    assert service._analyze_basic_sentiment("Three bedrooms, two baths") == "neutral"
+    assert service._analyze_basic_sentiment("Unhappy sellers, saddest listing, bestowed with light") == "neutral"
+    # Contractions and possessives stay whole words instead of splitting into lexicon hits.
+    assert service._analyze_basic_sentiment("Love's not enough when the commute is bad") == "negative"
+    assert service._analyze_basic_sentiment("Don't miss it, it's perfect") == "positive"
+
+
+def test_process_content_upload_extracts_tags_in_order(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    text = "Open house with @JaneRealtor this #Weekend in #Windsor, thanks @team"
+
+    processed = service.process_content_upload({"text": text})
+
+    assert processed["hashtags"] == service.extract_hashtags(text) == ["#weekend", "#windsor"]
+    assert processed["mentions"] == service.extract_mentions(text) == ["@janerealtor", "@team"]
+
+
+def test_get_content_stats_aggregates_items(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content(
+        {"text": "a", "platform": "instagram", "hashtags": ["#home", "#windsor"], "engagement": {"likes": 4}}
+    )
+    service.save_content(
+        {"text": "b", "platform": "facebook", "content_type": "image", "hashtags": ["#home"], "engagement": {"likes": 2, "comments": 3}}
+    )
+    service.save_content({"text": "c", "platform": "instagram", "uploaded_at": "2020-01-01T00:00:00Z"})
+
+    stats = service.get_content_stats()
+
+    assert stats["total_posts"] == 3
+    assert stats["platforms"] == {"instagram": 2, "facebook": 1}
+    assert stats["content_types"] == {"text": 2, "image": 1}
+    assert stats["recent_activity"]["posts_last_30_days"] == 2
+    assert stats["hashtag_usage"] == {"#home": 2, "#windsor": 1}
+    assert stats["engagement_summary"]["total_likes"] == 6
+    assert stats["engagement_summary"]["avg_comments_per_post"] == 1
+
+
+def test_save_content_writes_compact_json_without_leftovers(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    content_id = service.save_content({"text": "hello"})
+    service.update_content(content_id, {"text": "updated"})
+
+    assert [path.name for path in tmp_path.iterdir()] == [f"{content_id}.json"]
+    assert "\n" not in (tmp_path / f"{content_id}.json").read_text(encoding="utf-8")
+
+
+def test_written_files_keep_umask_mode_and_existing_permissions(tmp_path):
+    import os
+
+    service = ManualContentService(storage_path=tmp_path)
+    previous_umask = os.umask(0o027)
+    try:
+        content_id = service.save_content({"text": "hello"})
+    finally:
+        os.umask(previous_umask)
+    path = tmp_path / f"{content_id}.json"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+    path.chmod(0o604)
+    service.update_content(content_id, {"text": "updated"})
+    assert path.stat().st_mode & 0o777 == 0o604
+
+
+def test_export_content_csv_quotes_values(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content(
+        {"id": "a", "text": 'Say "hi", neighbour', "hashtags": ["#home"], "uploaded_at": "2024-01-01T00:00:00Z"}
+    )
+
+    exported = service.export_content("csv")
+
+    assert exported.splitlines() == [
+        "hashtags,id,status,text,uploaded_at",
+        '"[""#home""]","a","active","Say ""hi"", neighbour","2024-01-01T00:00:00Z"',
+    ]
+
+
+def test_export_content_csv_writes_none_as_text(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "b", "platform": None, "uploaded_at": "2024-01-01T00:00:00Z"})
+
+    assert service.export_content("csv").splitlines()[1] == '"a","None","active","b","2024-01-01T00:00:00Z"'
+
+
+def test_search_content_platform_index_follows_updates(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "Sunny condo", "platform": "instagram"})
+    service.save_content({"id": "b", "text": "Sunny bungalow", "platform": "facebook"})
+
+    assert [item["id"] for item in service.search_content("sunny", {"platform": "instagram"})] == ["a"]
+
+    service.update_content("b", {"platform": "instagram"})
+    assert {item["id"] for item in service.search_content("sunny", {"platform": "instagram"})} == {"a", "b"}
+    assert service.search_content("", {"platform": "facebook"}) == []
+
+
+def test_search_content_sees_edits_to_cached_items(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "Waterfront Condo"})
+    assert [item["id"] for item in service.search_content("waterfront")] == ["a"]
+
+    service.update_content("a", {"text": "Downtown loft"})
+    assert service.search_content("waterfront") == []
+    assert [item["id"] for item in service.search_content("LOFT")] == ["a"]
+
+
+def test_import_content_reports_failures_by_position(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    items = [{"text": f"Listing {index} #home"} for index in range(12)]
+    items[4] = None
+
+    results = service.import_content(items)
+
+    assert results["imported"] == 11
+    assert results["failed"] == 1
+    assert results["errors"][0].startswith("Item 5:")
+    assert len(service.get_all_content(limit=100)) == 11
+
+
+def test_save_content_completes_payload_in_place(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    payload = {"text": "hello", "id": ""}
+    content_id = service.save_content(payload)
+
+    assert payload["id"] == content_id and content_id
+    assert payload["status"] == "active"
+    assert payload["uploaded_at"].endswith("Z")
+    assert service.get_content(content_id) == payload
+
+
+def test_content_stats_follow_updates_deletes_and_other_writers(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "a", "platform": "instagram", "hashtags": ["#home"], "engagement": {"likes": 4}})
+    service.save_content({"id": "b", "text": "b", "platform": "facebook", "hashtags": ["#home"]})
+    service.get_content_stats()
+
+    service.update_content("a", {"platform": "facebook", "hashtags": ["#condo"], "engagement": {"likes": 1}})
+    service.delete_content("b")
+    ManualContentService(storage_path=tmp_path).save_content({"id": "c", "text": "c", "uploaded_at": "2020-01-01T00:00:00Z"})
+
+    stats = service.get_content_stats()
+    assert stats == ManualContentService(storage_path=tmp_path).get_content_stats()
+    assert stats["platforms"] == {"facebook": 1, "unknown": 1}
+    assert stats["hashtag_usage"] == {"#condo": 1}
+    assert stats["recent_activity"]["posts_last_30_days"] == 1
+    assert stats["engagement_summary"]["total_likes"] == 1
+
+
+def test_malformed_platform_and_hashtags_do_not_break_reads(tmp_path):
+    import json
+    from collections import Counter
+
+    from src.services import manual_content_service as module
+
+    path = tmp_path / "odd.json"
+    path.write_text(json.dumps({"id": "odd", "text": "x", "platform": ["ig"], "hashtags": [{"tag": "#a"}, "#home"]}))
+    service = ManualContentService(storage_path=tmp_path)
+
+    assert service.get_content("odd")["platform"] == ["ig"]
+    assert service.get_content_stats()["platforms"] == {"['ig']": 1}
+    path.write_text(json.dumps({"id": "odd", "text": "y", "platform": {"name": "ig"}, "hashtags": 3}))
+    assert [item["text"] for item in service.get_all_content()] == ["y"]
+    assert service.get_content_stats()["hashtag_usage"] == {}
+
+    counts = Counter({"#home": 1})
+    module._discount(counts, ["#home", "#missing"])
+    assert counts == Counter()
+
+
+def test_content_stats_window_only_counts_most_recent_posts(tmp_path, monkeypatch):
+    from src.services import manual_content_service as module
+
+    monkeypatch.setattr(module, "STATS_WINDOW", 2)
+    service = ManualContentService(storage_path=tmp_path)
+    for index, platform in enumerate(["old", "instagram", "facebook"]):
+        service.save_content({"id": str(index), "text": "x", "platform": platform, "uploaded_at": f"2024-01-0{index + 1}T00:00:00Z"})
+
+    assert service.get_content_stats()["platforms"] == {"instagram": 1, "facebook": 1}
+
+
+def test_search_content_stops_at_max_results(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    for index in range(5):
+        service.save_content({"id": str(index), "text": "Sunny condo", "uploaded_at": f"2024-01-0{index + 1}T00:00:00Z"})
+
+    assert [item["id"] for item in service.search_content("sunny", max_results=2)] == ["4", "3"]
+    assert len(service.search_content("sunny")) == 5
+    assert service.search_content("sunny", max_results=0) == []
+    assert service.search_content("sunny", max_results=-1) == []
+
+
+def test_import_content_reuses_and_then_clears_text_analysis(tmp_path):
+    from src.services import manual_content_service as module
+
+    module._clear_text_caches()
+    service = ManualContentService(storage_path=tmp_path)
+    processed = [service.process_content_upload({"text": "DM me! #Windsor"}) for _ in range(3)]
+
+    assert module._scan_tags.cache_info().hits == 2
+    processed[0]["hashtags"].append("#mutated")
+    assert processed[1]["hashtags"] == ["#windsor"]
+
+    assert service.import_content([{"text": "DM me! #Windsor"}] * 3)["imported"] == 3
+    assert module._scan_tags.cache_info().currsize == 0
+
+
+def test_upload_key_manifest_tracks_rewrites(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "x", "platform": "instagram", "uploaded_at": "2024-01-01T00:00:00Z"})
+    service.save_content({"id": "b", "text": "x", "platform": "instagram", "uploaded_at": "2024-01-02T00:00:00Z"})
+    assert [item["id"] for item in service.get_all_content(limit=1)] == ["b"]
+
+    ManualContentService(storage_path=tmp_path).update_content("a", {"uploaded_at": "2024-01-03T00:00:00+00:00"})
+
+    assert [item["id"] for item in service.get_all_content(limit=1)] == ["a"]
+    assert service._upload_keys == {"a.json": "2024-01-03T00:00:00Z", "b.json": "2024-01-02T00:00:00Z"}
+    results = service.search_content("", {"platform": "instagram", "date_from": "2024-01-02T12:00:00Z"})
+    assert [item["id"] for item in results] == ["a"]
+
+
+def test_read_json_handles_files_that_grew_or_are_empty(tmp_path):
+    path = tmp_path / "grown.json"
+    path.write_text('{"id": "grown", "text": "longer than the stale size"}', encoding="utf-8")
+    (tmp_path / "empty.json").write_bytes(b"")
+
+    assert ManualContentService._read_json(path, size=4)["id"] == "grown"
+    assert ManualContentService._read_json(tmp_path / "empty.json") is None
+    assert ManualContentService._read_json(tmp_path / "missing.json") is None
+
+
+def test_import_content_stamps_batch_with_one_timestamp(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.import_content([{"id": str(index), "text": "x"} for index in range(10)])
+
+    stamps = {(item["uploaded_at"], item["processed_at"]) for item in service.get_all_content(limit=20)}
+    assert len(stamps) == 1
+    uploaded_at, processed_at = stamps.pop()
+    assert uploaded_at == processed_at and uploaded_at.endswith("Z") and len(uploaded_at) == 20
+
+
+def test_search_content_date_window_on_newest_first_candidates(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    for index in range(1, 6):
+        service.save_content({"id": str(index), "text": "x", "uploaded_at": f"2024-01-0{index}T00:00:00Z"})
+    service.save_content({"id": "undated", "text": "x", "uploaded_at": "not a date"})
+
+    results = service.search_content("", {"date_from": "2024-01-02T00:00:00Z", "date_to": "2024-01-04T00:00:00+00:00"})
+    assert [item["id"] for item in results] == ["4", "3", "2"]
+
+
+def test_search_content_hashtag_filter_uses_inverted_index(tmp_path):
+    service = ManualContentService(storage_path=tmp_path)
+    service.save_content({"id": "a", "text": "x", "platform": "instagram", "hashtags": ["#Home", "#windsor"]})
+    service.save_content({"id": "b", "text": "x", "platform": "facebook", "hashtags": ["#home"]})
+    service.save_content({"id": "c", "text": "x", "platform": "instagram", "hashtags": ["#homes"]})
+
+    assert sorted(item["id"] for item in service.search_content("", {"hashtag": "home"})) == ["a", "b"]
+    assert [item["id"] for item in service.search_content("", {"hashtag": "#HOME", "platform": "instagram"})] == ["a"]
+
+    service.update_content("a", {"hashtags": ["#condo"]})
+    assert [item["id"] for item in service.search_content("", {"hashtag": "#home"})] == ["b"]
+    assert "#windsor" not in service._by_hashtag
@@ -0,0 +1,308 @@
+import pytest
+
+from src.services import realtor_scraper_service as module
+from src.services.realtor_scraper_service import RealtorScraperService
+
+
+class _FakeRunClient:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self):
+        self.calls += 1
+        return {"status": self.statuses.pop(0)}
+
+
+class _FakeDataset:
+    def __init__(self, items):
+        self.items = list(items)
+        self.yielded = 0
+        self.clean = None
+
+    def iterate_items(self, clean=None):
+        self.clean = clean
+        for item in self.items:
+            self.yielded += 1
+            yield item
+
+
+class _FakeClient:
+    def __init__(self, run_client=None, items=()):
+        self.run_client = run_client
+        self.dataset_client = _FakeDataset(items)
+
+    def run(self, run_id):
+        return self.run_client
+
+    def dataset(self, dataset_id):
+        return self.dataset_client
+
+    def actor(self, actor_id):
+        return self
+
+    def call(self, run_input=None):
+        return {"id": "run", "status": "SUCCEEDED", "defaultDatasetId": "dataset"}
+
+
+def test_wait_for_dataset_ready_skips_polling_finished_runs(monkeypatch):
+    monkeypatch.setattr(module.time, "sleep", lambda seconds: None)
+    run_client = _FakeRunClient([])
+
+    RealtorScraperService()._wait_for_dataset_ready(_FakeClient(run_client), {"id": "r", "status": "SUCCEEDED"}, 1000)
+
+    assert run_client.calls == 0
+
+
+def test_wait_for_dataset_ready_backs_off_until_terminal_status(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(module.random, "uniform", lambda low, high: 0)
+    run_client = _FakeRunClient(["RUNNING", "RUNNING", "RUNNING", "SUCCEEDED"])
+
+    RealtorScraperService()._wait_for_dataset_ready(_FakeClient(run_client), {"id": "r", "status": "RUNNING"}, 60_000)
+
+    assert run_client.calls == 4
+    assert sleeps == [1.0, 2.0, 4.0, 8.0]
+
+
+def test_collect_dataset_items_streams_and_caps_items():
+    client = _FakeClient(items=[{"id": index} for index in range(10)])
+    dataset = client.dataset_client
+
+    items = RealtorScraperService()._collect_dataset_items(client, "d", max_items=3)
+
+    assert dataset.yielded == 0
+    assert [item["id"] for item in items] == [0, 1, 2]
+    assert dataset.yielded == 3
+
+
+def test_collect_dataset_items_strips_hidden_fields_client_side():
+    client = _FakeClient(items=[{"#debug": {"url": "x"}}, {"id": 1, "#error": False}, {}, {"id": 2}])
+
+    items = list(RealtorScraperService()._collect_dataset_items(client, "d", max_items=2))
+
+    assert client.dataset_client.clean is False
+    assert items == [{"id": 1}, {"id": 2}]
+
+
+def test_prefetch_preserves_order_and_reraises_errors():
+    def failing():
+        yield 1
+        yield 2
+        raise ValueError("page failed")
+
+    assert list(module._prefetch(iter(range(50)), buffer_size=4)) == list(range(50))
+    received = []
+    with pytest.raises(ValueError, match="page failed"):
+        for item in module._prefetch(failing()):
+            received.append(item)
+    assert received == [1, 2]
+
+
+def test_prefetch_close_stops_producer_and_closes_source():
+    import threading
+
+    closed = threading.Event()
+
+    def endless():
+        try:
+            count = 0
+            while True:
+                yield count
+                count += 1
+        finally:
+            closed.set()
+
+    records = module._prefetch(endless(), buffer_size=2)
+    assert next(records) == 0
+    records.close()
+
+    assert closed.is_set()
+    assert not any(thread.name == "apify-dataset-prefetch" for thread in threading.enumerate())
+
+
+def test_numeric_parsing_and_absolute_urls():
+    service = RealtorScraperService()
+
+    assert service._parse_price("$450,000") == 450000.0
+    assert service._parse_price({"amount": "399900"}) == 399900.0
+    assert service._extract_number("2.5 baths") == 2.5
+    assert service._extract_number("n/a") is None
+    assert service._ensure_absolute_url("HTTPS://example.com/a") == "HTTPS://example.com/a"
+    assert service._ensure_absolute_url("real-estate/123") == "https://www.realtor.ca/real-estate/123"
+
+
+def test_extract_features_and_coordinates_follow_nested_paths():
+    service = RealtorScraperService()
+    listing = {
+        "building": {"bedrooms": "3", "sizeInterior": "1,850 sqft"},
+        "property": {"building": {"bathrooms": 2}, "location": {"latitude": "42.3", "longitude": "-83.0"}},
+        "details": [{"label": "Year Built", "value": "1998"}, ["Lot Size", "50 x 120 ft"]],
+    }
+
+    features = service._extract_features(listing)
+
+    assert features["bedrooms"] == 3.0
+    assert features["bathrooms"] == 2
+    assert features["squareFeet"] == 1850.0
+    assert features["yearBuilt"] == 1998.0
+    assert features["lotSizeText"] == "50 x 120 ft"
+    assert service._extract_coordinates(listing) == {"lat": 42.3, "lng": -83.0}
+
+
+def _raw_listing(**overrides):
+    record = {
+        "mlsNumber": "X123",
+        "price": "$450,000",
+        "property": {
+            "address": {"addressLine1": "1 Riverside Dr", "city": "Windsor", "province": "ON", "postalCode": "N9A 1A1"},
+            "type": "House",
+            "url": "/real-estate/123/1-riverside-dr",
+            "photo": {"highResPaths": ["https://cdn.realtor.ca/a.jpg"]},
+        },
+        "building": {"bedrooms": 3},
+        "agents": [{"name": "Jane Doe", "phone": "519-555-0100"}],
+    }
+    record.update(overrides)
+    return record
+
+
+def test_normalize_listing_reads_nested_property_fields():
+    listing = RealtorScraperService()._normalize_listing(_raw_listing(property="not a dict"))
+    assert listing.mlsNumber == "X123"
+    assert listing.propertyType is None
+
+    listing = RealtorScraperService()._normalize_listing(_raw_listing())
+    assert listing.city == "Windsor"
+    assert listing.address == "1 Riverside Dr, Windsor, ON, N9A 1A1"
+    assert listing.price == 450000.0
+    assert listing.priceFormatted == "$450,000"
+    assert listing.propertyType == "House"
+    assert listing.listingUrl == "https://www.realtor.ca/real-estate/123/1-riverside-dr"
+    assert listing.bedrooms == 3
+    assert listing.images == ["https://cdn.realtor.ca/a.jpg"]
+    assert listing.agents[0]["name"] == "Jane Doe"
+
+
+def test_scrape_filters_by_city_and_drops_duplicates(monkeypatch):
+    records = [
+        _raw_listing(),
+        _raw_listing(price="$460,000"),
+        _raw_listing(mlsNumber="X124", city="Toronto", property={"address": {"city": "Toronto"}}),
+        _raw_listing(mlsNumber="X125", agents=[{"name": "Jane Doe"}, {"name": "JANE DOE"}, {"name": "Sam Roe"}]),
+        "not a record",
+    ]
+    monkeypatch.setenv("APIFY_API_KEY", "token")
+    monkeypatch.setattr(module, "ApifyClient", lambda token: _FakeClient(items=records))
+
+    listings = RealtorScraperService().scrape_windsor_essex_properties()
+
+    assert [(listing.mlsNumber, listing.price) for listing in listings] == [("X123", 450000.0), ("X125", 450000.0)]
+    assert [agent["name"] for agent in listings[1].agents] == ["Jane Doe", "Sam Roe"]
+
+
+def test_extract_images_absolutises_and_dedupes_in_order():
+    listing = {
+        "images": ["/photos/b.jpg", "photos/a.jpg", None, "  "],
+        "property": {"photo": {"highResPaths": ["https://www.realtor.ca/photos/b.jpg", "https://cdn.example/c.jpg"]}},
+        "gallery": {"first": "https://cdn.example/c.jpg"},
+    }
+
+    assert RealtorScraperService()._extract_images(listing) == [
+        "https://www.realtor.ca/photos/b.jpg",
+        "https://www.realtor.ca/photos/a.jpg",
+        "https://cdn.example/c.jpg",
+    ]
+
+
+def test_normalized_city_names_are_interned():
+    service = RealtorScraperService()
+    first = service._normalize_listing(_raw_listing(city="".join(["Wind", "sor"]), property={}))
+    second = service._normalize_listing(_raw_listing(city="".join(["Windso", "r"]), property={}))
+
+    assert first.city == "Windsor"
+    assert first.city is second.city
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_detail_labels_fill_missing_features(monkeypatch, use_automaton):
+    if not use_automaton:
+        monkeypatch.setattr(module, "_DETAIL_AUTOMATON", None)
+    listing = {
+        "property": {
+            "details": [
+                {"label": "Total Bedrooms", "value": "4"},
+                {"name": "Bathrooms (Full)", "text": "2"},
+                {"label": "Beds above grade", "value": "3"},
+                "Interior 1,200 sqft",
+                ["Land Size", "0.25 acres"],
+                {"label": "Year built", "display": "1975"},
+            ]
+        }
+    }
+
+    features = RealtorScraperService()._extract_features(listing)
+
+    assert features == {
+        "bedrooms": 4.0,
+        "bathrooms": 2.0,
+        "squareFeet": 1200.0,
+        "lotSize": 0.25,
+        "lotSizeText": "0.25 acres",
+        "yearBuilt": 1975.0,
+    }
+
+
+def test_serialize_scrape_response_stamps_seconds_precision_utc():
+    from datetime import datetime
+
+    payload = module.serialize_scrape_response([{"id": "1"}])
+
+    assert payload["properties"] == [{"id": "1"}]
+    assert payload["source"] == "apify"
+    parsed = datetime.fromisoformat(payload["lastUpdated"])
+    assert parsed.utcoffset().total_seconds() == 0 and parsed.microsecond == 0
+
+
+def test_clean_string_collapses_whitespace_including_nbsp():
+    clean = RealtorScraperService._clean_string
+
+    assert clean("  1\xa0Main\tSt \n Unit 5 ") == "1 Main St Unit 5"
+    assert clean(" \xa0 ") is None
+    assert clean(3) == "3"
+    assert clean(float("nan")) is None
+
+
+def test_peek_city_matches_normalized_city():
+    service = RealtorScraperService()
+    records = [
+        _raw_listing(),
+        _raw_listing(property={}, address={"municipality": " Belle\xa0River "}),
+        _raw_listing(property={"location": {"city": "Toronto"}}),
+        _raw_listing(property={}, city=None),
+        "not a record",
+    ]
+
+    assert [service._peek_city(record) for record in records] == ["windsor", "belle river", "toronto", None, None]
+    for record in records[:3]:
+        assert service._normalize_listing(record).city.lower() == service._peek_city(record)
+
+
+def test_extract_images_collapses_sizes_of_the_same_photo():
+    listing = {
+        "property": {
+            "photo": {
+                "highResPaths": ["https://cdn.realtor.ca/listings/reb89/highres/5/X123_1.jpg?v=2"],
+                "lowResPaths": [
+                    "https://CDN.realtor.ca/listings/reb89/lowres/5/X123_1.jpg",
+                    "https://cdn.realtor.ca/listings/reb89/lowres/5/X123_2.jpg",
+                ],
+            }
+        }
+    }
+
+    assert RealtorScraperService()._extract_images(listing) == [
+        "https://cdn.realtor.ca/listings/reb89/highres/5/X123_1.jpg?v=2",
+        "https://cdn.realtor.ca/listings/reb89/lowres/5/X123_2.jpg",
+    ]
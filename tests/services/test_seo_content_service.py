@@ -0,0 +1,214 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import seo_content_service as module
+from src.services.seo_content_service import SEOContentService
+
+
+@pytest.fixture(autouse=True)
+def _fresh_text_caches():
+    module._clear_text_caches()
+    yield
+    module._clear_text_caches()
+
+
+POST = "Just listed: a family home for sale in Windsor. This house is a great real estate listing in Windsor!"
+
+
+def test_seo_metadata_counts_whole_word_keywords():
+    metadata = SEOContentService()._generate_seo_metadata(POST, "Windsor", "property_showcase")
+
+    assert set(metadata["keyword_density"]) == {"real estate", "house", "listing"}
+    assert metadata["keyword_density"]["house"] == round(100 / 19, 2)
+    assert metadata["overall_keyword_density"] == round(300 / 19, 2)
+    assert metadata["location_mentions"] == 2
+
+
+def test_keyword_patterns_follow_reloaded_config(tmp_path):
+    config = tmp_path / "seo_keywords.json"
+    config.write_text('{"real_estate_keywords": {"primary": ["condo"]}}', encoding="utf-8")
+    service = SEOContentService(config_path=str(config))
+
+    assert list(service._generate_seo_metadata("Condo, condos and a condo.", "Windsor", "general")["keyword_density"]) == ["condo"]
+
+    config.write_text('{"real_estate_keywords": {"primary": ["loft"]}}', encoding="utf-8")
+    service.reload_config()
+
+    assert service._keywords == [("loft", "loft")]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_keyword_counts_match_word_bounded_regex(tmp_path, monkeypatch, use_automaton):
+    if not use_automaton:
+        monkeypatch.setattr(module, "ahocorasick", None)
+    config = tmp_path / "seo_keywords.json"
+    config.write_text(
+        '{"real_estate_keywords": {"primary": ["Home", "home home", "real estate", "c++"], "long_tail": ["home"]}}',
+        encoding="utf-8",
+    )
+    service = SEOContentService(config_path=str(config))
+    content = "home home home, homes_home real-estate real estate! home_ c++ c++x (home)"
+
+    expected = {key: len(pattern.findall(content)) for key, pattern in service._keyword_patterns.items()}
+
+    assert (service._keyword_automaton is not None) is use_automaton
+    assert dict(service._count_keywords(content)) == expected
+    assert expected == {"home": 4, "home home": 1, "real estate": 1, "c++": 1}
+
+
+def test_seo_metadata_measures_content_once(monkeypatch):
+    service = SEOContentService()
+    scans = []
+    count_keywords = service._count_keywords
+    monkeypatch.setattr(service, "_count_keywords", lambda text: scans.append(text) or count_keywords(text))
+
+    metadata = service._generate_seo_metadata(POST, "Windsor", "property_showcase")
+
+    readability = module._flesch_reading_ease.cache_info()
+    assert (readability.hits, readability.misses) == (0, 1) and len(scans) == 1
+    assert metadata["readability_score"] == 81.42
+    assert metadata["seo_score"] == service._calculate_seo_score(POST, "Windsor", "property_showcase")[0]
+
+
+def test_repeated_scoring_of_a_post_is_cached():
+    service = SEOContentService()
+    checked = []
+    service._grammar_tool = SimpleNamespace(check=lambda content: checked.append(content) or ["error"])
+    service._grammar_check_enabled = True
+
+    metadata = service._generate_seo_metadata(POST, service.default_region, "general")
+    service._calculate_engagement_score(POST, ["#Windsor"], "instagram")
+    optimization = service.optimize_existing_content(POST)
+
+    sentiment_calls = module._sentiment_polarity.cache_info()
+    assert (sentiment_calls.hits, sentiment_calls.misses) == (0, 1) and checked == [POST]
+    assert metadata["seo_score"] == optimization["current_seo_score"]
+    assert metadata["grammar_errors"] == 1
+
+    service.reload_config()
+    service._calculate_seo_score(POST, service.default_region, "general")
+    assert checked == [POST, POST]
+
+
+def test_sentiment_polarity_balances_opinion_words():
+    assert module._sentiment_polarity("Stunning, spacious and bright!") == 1.0
+    assert module._sentiment_polarity("Great yard but a cramped, dated kitchen") == -1 / 3
+    assert module._sentiment_polarity("Three bedrooms near the river") == 0.0
+
+
+class _FakeGrammarSession:
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, data=None, timeout=None):
+        self.requests.append((url, data["text"]))
+        matches = [{"message": "typo"}] * data["text"].count("teh")
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"matches": matches})
+
+
+def test_evaluate_posts_checks_grammar_against_server_in_one_batch(monkeypatch):
+    session = _FakeGrammarSession()
+    monkeypatch.setenv("ENABLE_GRAMMAR_CHECK", "true")
+    monkeypatch.setenv("LANGUAGETOOL_URL", "http://lt.local:8081/")
+    monkeypatch.setattr(module, "_build_grammar_session", lambda: session)
+    service = SEOContentService()
+    posts = [
+        {"id": 1, "content": "teh best home in Windsor"},
+        {"id": 2, "content": "A great house, DM me"},
+        {"id": 3, "content": "teh best home in Windsor"},
+        {"id": 4},
+    ]
+
+    result = service.evaluate_posts(posts)
+
+    assert sorted(session.requests) == [
+        ("http://lt.local:8081/v2/check", "A great house, DM me"),
+        ("http://lt.local:8081/v2/check", "teh best home in Windsor"),
+    ]
+    assert [evaluation["grammar_errors"] for evaluation in result["evaluations"]] == [1, 0, 1]
+
+
+def test_scorers_share_one_featurisation_per_post():
+    service = SEOContentService()
+
+    service._generate_seo_metadata(POST, "Windsor", "property_showcase")
+    service._calculate_engagement_score(POST, [], "facebook")
+    service.optimize_existing_content(POST)
+
+    features = module._featurize.cache_info()
+    assert (features.misses, features.currsize) == (1, 1)
+    assert module._featurize(POST).word_count == 19
+
+
+def test_weighted_sample_draws_distinct_tags_favouring_trending_ones():
+    service = SEOContentService()
+    tags = [f"#tag{index}" for index in range(10)]
+    service.trend_scores = {"#tag3": 1e9, "#tag7": 0.0}
+
+    for _ in range(50):
+        sample = service._weighted_sample(tags, 4)
+        assert len(sample) == len(set(sample)) == 4
+        assert sample[0] == "#tag3"
+    assert sorted(service._weighted_sample(tags, 20)) == sorted(tags)
+    assert service._weighted_sample(tags, 0) == []
+
+
+def test_flesch_reading_ease_counts_words_sentences_and_syllables():
+    # 6 words, 1 sentence, 6 syllables: 206.835 - 1.015 * 6 - 84.6 * 1
+    assert module._flesch_reading_ease("The cat sat on the mat.") == 116.15
+    # 4 words over 2 sentences; "beautiful" has 3 syllables and the rest 1 each.
+    assert module._flesch_reading_ease("Beautiful home. Don't wait!") == round(206.835 - 1.015 * 2 - 84.6 * 6 / 4, 2)
+    assert module._flesch_reading_ease("🏡 💰 !!") == 0.0
+    words = ("home", "sale", "table", "free", "estate", "rhythm")
+    assert [module._count_syllables(word) for word in words] == [1, 1, 2, 1, 2, 1]
+
+
+def test_local_language_tool_starts_on_first_grammar_check(monkeypatch):
+    started = []
+
+    class _FakeLanguageTool:
+        def __init__(self, language, config=None):
+            started.append((language, config))
+
+        def check(self, content):
+            return ["error"] * content.count("teh")
+
+    monkeypatch.setitem(sys.modules, "language_tool_python", SimpleNamespace(LanguageTool=_FakeLanguageTool))
+    monkeypatch.setenv("ENABLE_GRAMMAR_CHECK", "1")
+    monkeypatch.delenv("LANGUAGETOOL_URL", raising=False)
+    service = SEOContentService()
+
+    assert started == []
+    assert service._count_grammar_errors("teh home") == 1
+    assert service._count_grammar_errors("teh teh house") == 2
+    assert started == [("en-US", module.LOCAL_GRAMMAR_CONFIG)]
+
+
+def test_grammar_check_disables_itself_when_language_tool_is_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "language_tool_python", None)
+    monkeypatch.setenv("ENABLE_GRAMMAR_CHECK", "1")
+    monkeypatch.delenv("LANGUAGETOOL_URL", raising=False)
+    service = SEOContentService()
+
+    assert service._count_grammar_errors("teh home") == 0
+    assert service._grammar_check_enabled is False
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_config_json_is_reparsed_only_when_the_file_changes(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(module, "orjson", None)
+    config = tmp_path / "seo_keywords.json"
+    config.write_text('{"real_estate_keywords": {"primary": ["condo"]}}', encoding="utf-8")
+    first = SEOContentService(config_path=str(config))
+    second = SEOContentService(config_path=str(config))
+
+    assert second.real_estate_keywords is first.real_estate_keywords
+
+    config.write_text('{"real_estate_keywords": {"primary": ["loft", "condo"]}}', encoding="utf-8")
+    second.reload_config()
+
+    assert second.real_estate_keywords == {"primary": ["loft", "condo"]}
+    assert first.real_estate_keywords == {"primary": ["condo"]}
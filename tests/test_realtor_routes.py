@@ -0,0 +1,34 @@
+import pytest
+from flask import Flask
+
+from src.routes import realtor_routes
+from src.services.realtor_scraper_service import RealtorScraperService
+
+
+class _StubScraper:
+    is_configured = True
+
+    def scrape_windsor_essex_properties(self):
+        raw = {"id": "1", "price": 450000, "city": "Windsor", "agents": [{"name": "Jane Doe"}]}
+        return [RealtorScraperService()._normalize_listing(raw)]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_properties_route_returns_json_payload(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(realtor_routes, "orjson", None)
+    monkeypatch.setattr(realtor_routes, "_scraper_service", _StubScraper())
+    app = Flask(__name__)
+    app.register_blueprint(realtor_routes.realtor_bp)
+
+    response = app.test_client().get("/properties")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    body = response.get_json()
+    listing = body["properties"][0]
+    assert listing["price"] == 450000.0
+    assert listing["city"] == "Windsor"
+    assert listing["images"] == [] and listing["coordinates"] is None
+    assert listing["agents"][0]["name"] == "Jane Doe"
+    assert body["source"] == "apify"